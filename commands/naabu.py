@@ -15,11 +15,13 @@ except ImportError:
     print("Make sure you've run setup_tools.sh to install all required components.")
     # Provide fallback functions with compatible signatures
     def run_cmd(cmd, shell=False, check=False, use_sudo=False, timeout=300, retry=1, silent=False):
+        # Scan output goes straight to the inherited terminal unless silenced
+        output = subprocess.DEVNULL if silent else None
         try:
             if isinstance(cmd, str):
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=check, timeout=timeout)
+                result = subprocess.run(cmd, shell=True, stdout=output, stderr=output, check=check, timeout=timeout)
             else:
-                result = subprocess.run(cmd, capture_output=True, text=True, check=check, timeout=timeout)
+                result = subprocess.run(cmd, stdout=output, stderr=output, check=check, timeout=timeout)
             return result.returncode == 0
         except Exception:
             return False
@@ -363,7 +365,7 @@ def auto_install_naabu():
             # Add ~/go/bin to PATH if not already there
             go_bin_path = os.path.expanduser("~/go/bin")
             current_path = os.environ.get("PATH", "")
-            if go_bin_path not in current_path:
+            if go_bin_path not in current_path.split(os.pathsep):
                 os.environ["PATH"] = f"{go_bin_path}:{current_path}"
                 print(f" Added {go_bin_path} to PATH for this session")
             
@@ -14,11 +14,13 @@ except ImportError:
     print("Make sure you've run setup_tools.sh to install all required components.")
     # Provide fallback functions with compatible signatures
     def run_cmd(cmd, shell=False, check=False, use_sudo=False, timeout=300, retry=1, silent=False):
+        # Scan output goes straight to the inherited terminal unless silenced
+        output = subprocess.DEVNULL if silent else None
         try:
             if isinstance(cmd, str):
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=check, timeout=timeout)
+                result = subprocess.run(cmd, shell=True, stdout=output, stderr=output, check=check, timeout=timeout)
             else:
-                result = subprocess.run(cmd, capture_output=True, text=True, check=check, timeout=timeout)
+                result = subprocess.run(cmd, stdout=output, stderr=output, check=check, timeout=timeout)
             return result.returncode == 0
         except Exception:
             return False
@@ -16,7 +16,7 @@ Vulnerability Analysis Toolkit. It handles everything:
 - Configuration optimization
 - Complete system verification
 
-Usage: sudo python3 install/setup.py
+Usage: sudo python3 install/setup.py [--force]
 
 Requirements:
 - Linux operating system (Debian/Ubuntu/Kali/Arch)
@@ -28,17 +28,56 @@ Requirements:
 """
 
 import os
+import argparse
 import sys
 import platform
 import subprocess
 import shutil
 import json
+import hashlib
 import time
-import ctypes
 import urllib.request
 import signal
+import sysconfig
+import tarfile
+import tempfile
+import concurrent.futures
+import collections
+import compileall
+import functools
+import importlib.util
+import threading
+import runpy
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+# Platform facts that cannot change while the installer runs
+SYSTEM_NAME = platform.system().lower()
+HOME_DIR = os.path.expanduser('~')
+# Repository root (this file lives in <root>/install)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# uname machine names -> Go release archive architectures
+_ARCH_MAP = {
+    'x86_64': 'amd64',
+    'amd64': 'amd64',
+    'aarch64': 'arm64',
+    'arm64': 'arm64',
+    'armv7l': 'armv6l',
+    'armv6l': 'armv6l',
+    'i386': '386',
+    'i686': '386',
+}
+GO_ARCH = _ARCH_MAP.get(platform.machine().lower(), 'amd64')
+
+# freedesktop.org release file; ID and ID_LIKE identify the distribution
+OS_RELEASE_PATH = '/etc/os-release'
+
+# Steps verified by a recent run are skipped on reruns within this window (see --force)
+INSTALL_STATE_FILE = os.path.join(HOME_DIR, '.cache', 'vuln-analysis-setup', 'state.json')
+INSTALL_STATE_TTL = 3600  # seconds
+# Verified steps only carry over while the interpreter and host platform stay the same
+INSTALL_STATE_ENVIRONMENT = hashlib.sha256(f"{sys.version}|{platform.platform()}".encode()).hexdigest()
 
 # ANSI Color codes for output
 class Colors:
@@ -85,6 +124,35 @@ SUPPORTED_DISTROS = {
     }
 }
 
+# Go-based security tools installed in Phase 3 (repository and go install timeout)
+GO_TOOLS = {
+    'naabu': {
+        'repo': 'github.com/projectdiscovery/naabu/v2/cmd/naabu@v2.1.8',
+        'timeout': 600
+    },
+    'httpx': {
+        'repo': 'github.com/projectdiscovery/httpx/cmd/httpx@v1.3.7',
+        'timeout': 450
+    },
+    'nuclei': {
+        'repo': 'github.com/projectdiscovery/nuclei/v3/cmd/nuclei@latest',
+        'timeout': 600
+    }
+}
+
+# Let apt pipeline package downloads from the same mirror
+APT_PARALLEL_FETCH_OPTIONS = ['-o', 'Acquire::Queue-Mode=host', '-o', 'Acquire::http::Pipeline-Depth=5']
+
+# Strip symbol tables and DWARF data from the Go tool binaries
+GO_LDFLAGS = '-s -w'
+
+# pip flags for the installer's dependency installs: no self-update check against PyPI,
+# never block on a prompt, prefer ready-made wheels over building sdists, and keep the output short
+PIP_INSTALL_FLAGS = ['--disable-pip-version-check', '--no-input', '--prefer-binary', '-q']
+
+# Lines of command output kept by run_with_timeout for its error hints
+RUN_OUTPUT_TAIL_LINES = 40
+
 def print_header():
     """Print installation header."""
     print(f"{Colors.CYAN}{'='*80}{Colors.END}")
@@ -94,23 +162,20 @@ def print_header():
     print(f"{Colors.YELLOW}Platform: Linux-Only | Requires: Root/Sudo access{Colors.END}")
     print(f"{Colors.CYAN}{'='*80}{Colors.END}\n")
 
+@functools.lru_cache(maxsize=1)
 def detect_linux_distro() -> Optional[str]:
-    """Detect the Linux distribution with enhanced detection."""
+    """Detect the Linux distribution with enhanced detection (computed once per run)."""
     try:
-        # Try reading /etc/os-release first (most reliable)
-        if os.path.exists('/etc/os-release'):
-            with open('/etc/os-release', 'r') as f:
-                content = f.read()
-                if content:  # Ensure content is not None or empty
-                    content = content.lower()
-                    if 'kali' in content:
-                        return 'kali'
-                    elif 'arch' in content:
-                        return 'arch'
-                    elif 'ubuntu' in content:
-                        return 'ubuntu'
-                    elif 'debian' in content:
-                        return 'debian'
+        # Try reading /etc/os-release first (most reliable). Only ID and ID_LIKE name the
+        # distribution; free-text fields such as PRETTY_NAME may mention a parent distro
+        if os.path.exists(OS_RELEASE_PATH):
+            with open(OS_RELEASE_PATH, 'r') as f:
+                release = dict(line.rstrip('\n').split('=', 1) for line in f if '=' in line)
+            ids = [release.get('ID', '').strip('"\'').lower()]
+            ids += release.get('ID_LIKE', '').strip('"\'').lower().split()
+            for distro_id in ids:
+                if distro_id in SUPPORTED_DISTROS:
+                    return distro_id
         
         # Check /etc/debian_version for Debian-based systems
         if os.path.exists('/etc/debian_version'):
@@ -122,9 +187,9 @@ def detect_linux_distro() -> Optional[str]:
             return 'debian'
         
         # Fallback to package manager detection
-        if shutil.which('pacman'):
+        if _have('pacman'):
             return 'arch'
-        elif shutil.which('apt') or shutil.which('apt-get'):
+        elif _have('apt') or _have('apt-get'):
             return 'debian'
             
     except Exception as e:
@@ -132,9 +197,221 @@ def detect_linux_distro() -> Optional[str]:
     
     return None
 
+@functools.lru_cache(maxsize=1)
+def detect_shell_profiles() -> Tuple[str, ...]:
+    """Return the shell startup files that exist for the current user (computed once per run)."""
+    return tuple(os.path.join(HOME_DIR, profile) for profile in ['.bashrc', '.zshrc']
+                 if os.path.exists(os.path.join(HOME_DIR, profile)))
+
+def update_shell_profiles(marker: str, lines: List[str]) -> List[str]:
+    """Append the lines of a marked block missing from each shell profile; returns the updated profiles."""
+    updated = []
+    for profile_path in detect_shell_profiles():
+        try:
+            content_lines = set(Path(profile_path).read_text(errors='replace').splitlines())
+        except FileNotFoundError:
+            continue  # Removed since detection - nothing to update
+        
+        # Exact line membership keeps reruns idempotent while still adding lines
+        # that a newer installer introduced to an existing block
+        missing = [line for line in lines if line not in content_lines]
+        if not missing:
+            continue
+        # Append the whole block in one write so O_APPEND keeps it contiguous
+        with open(profile_path, 'a') as f:
+            f.write(f'\n{marker}\n' + ''.join(f'{line}\n' for line in missing))
+        updated.append(profile_path)
+    return updated
+
+def is_in_path(directory: str) -> bool:
+    """Check whether a directory is an exact component of PATH (not just a substring)."""
+    path_parts = set(os.environ.get('PATH', '').split(os.pathsep))
+    return directory in path_parts
+
+def prepend_to_path(directory: str) -> bool:
+    """Put a directory at the front of PATH once. Returns True if PATH changed."""
+    current = os.environ.get('PATH', '')
+    if directory in current.split(os.pathsep):
+        return False
+    os.environ['PATH'] = os.pathsep.join(filter(None, [directory, current]))
+    return True
+
+def write_file_atomic(path: str, data: bytes, mode: int = 0o644) -> None:
+    """Write a file via a same-directory temp file and rename, so readers never see it half-written."""
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            os.fchmod(f.fileno(), mode)  # Mode is final before the file becomes visible
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# Reject absolute paths, parent-directory escapes and device files on Pythons that
+# ship extraction filters (3.12+, backported to security releases of 3.8-3.11)
+TAR_EXTRACT_KWARGS = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+
+class _HashingReader:
+    """Read-only file wrapper that feeds every byte handed to tarfile through a hash."""
+    def __init__(self, raw, digest):
+        self.raw = raw
+        self.digest = digest
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.raw.read(size)
+        self.digest.update(data)
+        return data
+
+    def drain(self) -> None:
+        """Hash whatever trails the end-of-archive marker so the digest covers the whole file."""
+        while self.read(65536):
+            pass
+
+# Run under sudo when the installer itself is not root: the helper re-imports this
+# module and installs the archive with the same code path
+_STREAM_EXTRACT_SCRIPT = (
+    "import sys\n"
+    "sys.dont_write_bytecode = True\n"
+    "sys.path.insert(0, sys.argv[1])\n"
+    "from setup import install_tarball\n"
+    "install_tarball(sys.argv[2], sys.argv[3], sys.argv[4] or None)\n"
+)
+
+def fetch_published_sha256(url: str) -> Optional[str]:
+    """Fetch the checksum published next to a download (<url>.sha256), or None if unavailable."""
+    try:
+        with urllib.request.urlopen(f"{url}.sha256", timeout=10) as resp:
+            return resp.read().decode().split()[0].lower()
+    except (OSError, IndexError, UnicodeDecodeError):
+        return None
+
+# Release index listing every Go archive with its sha256
+GO_RELEASES_URL = 'https://go.dev/dl/?mode=json&include=all'
+
+def go_release_sha256(filename: str) -> Optional[str]:
+    """Look up a Go archive's published sha256 in the go.dev release index."""
+    try:
+        with urllib.request.urlopen(GO_RELEASES_URL, timeout=15) as resp:
+            releases = json.load(resp)
+    except (OSError, ValueError):
+        return None
+    for release in releases:
+        for entry in release.get('files', []):
+            if entry.get('filename') == filename and entry.get('sha256'):
+                return entry['sha256'].lower()
+    return None
+
+def install_tarball(url: str, dest: str, expected_sha256: Optional[str] = None) -> str:
+    """Stream a .tar.gz into a staging directory under dest and move its entries into place once verified."""
+    # Extraction starts before the checksum is known, so nothing lands in dest until it matches
+    os.makedirs(dest, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix='.staging-', dir=dest)
+    retired = None
+    try:
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(url, timeout=60) as resp:
+            reader = _HashingReader(resp, digest)
+            with tarfile.open(fileobj=reader, mode='r|gz') as archive:
+                archive.extractall(staging, **TAR_EXTRACT_KWARGS)
+            reader.drain()
+        actual = digest.hexdigest()
+        if expected_sha256 and actual != expected_sha256:
+            raise ValueError(f"checksum mismatch for {url}: expected {expected_sha256}, got {actual}")
+        moved_aside, moved_in = [], []
+        try:
+            for name in os.listdir(staging):
+                target = os.path.join(dest, name)
+                if os.path.lexists(target):
+                    # Rename the old entry aside rather than deleting it first, so the swap is two renames
+                    retired = retired or tempfile.mkdtemp(prefix='.retired-', dir=dest)
+                    os.replace(target, os.path.join(retired, name))
+                    moved_aside.append(name)
+                os.replace(os.path.join(staging, name), target)
+                moved_in.append(name)
+        except BaseException:
+            # Undo a partial swap: take the new entries back out and return the old ones
+            for name in moved_in:
+                try:
+                    os.replace(os.path.join(dest, name), os.path.join(staging, name))
+                except OSError:
+                    pass
+            for name in moved_aside:
+                try:
+                    os.replace(os.path.join(retired, name), os.path.join(dest, name))
+                except OSError:
+                    pass
+            if retired:
+                try:
+                    os.rmdir(retired)  # Only succeeds once every old entry is back in dest
+                except OSError:
+                    print(f"{Colors.RED}  Could not restore every entry in {dest}; the previous files are kept in {retired}{Colors.END}")
+                retired = None  # Never delete what could not be put back
+            raise
+        return actual
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+        if retired:
+            shutil.rmtree(retired, ignore_errors=True)
+
+def stream_extract_tarball(url: str, dest: str, expected_sha256: Optional[str] = None, privileged: bool = True) -> None:
+    """Download, verify and unpack a .tar.gz in one pass, without a temporary archive on disk."""
+    if not privileged or (hasattr(os, 'geteuid') and os.geteuid() == 0):
+        install_tarball(url, dest, expected_sha256)
+    else:
+        # A checksum mismatch surfaces as the helper's non-zero exit (CalledProcessError)
+        install_dir = os.path.dirname(os.path.abspath(__file__))
+        subprocess.run(['sudo', sys.executable, '-c', _STREAM_EXTRACT_SCRIPT,
+                        install_dir, url, dest, expected_sha256 or ''], check=True)
+
+# Tools already located this run. Only hits are cached: a miss may be installed later,
+# while a found binary is never removed by the installer
+_tool_path_cache: Dict[str, str] = {}
+
+def locate_tool(tool: str) -> Optional[str]:
+    """Find a command on PATH or in the Go bin directory, without spawning it."""
+    cached = _tool_path_cache.get(tool)
+    if cached:
+        return cached
+    path = shutil.which(tool)
+    if path is None:
+        gobin = os.environ.get('GOBIN') or os.path.join(HOME_DIR, 'go', 'bin')
+        candidate = os.path.join(gobin, tool)
+        if os.access(candidate, os.X_OK):
+            path = candidate
+    if path:
+        _tool_path_cache[tool] = path
+    return path
+
+def _have(tool: str) -> bool:
+    """Check whether a command is on PATH or in the Go bin directory, without spawning it."""
+    return locate_tool(tool) is not None
+
+def locate_tools(tools) -> Dict[str, str]:
+    """Find several commands with one directory scan per PATH entry instead of a PATH walk per command."""
+    found = {tool: _tool_path_cache[tool] for tool in tools if tool in _tool_path_cache}
+    wanted = set(tools) - found.keys()
+    gobin = os.environ.get('GOBIN') or os.path.join(HOME_DIR, 'go', 'bin')
+    for directory in os.environ.get('PATH', '').split(os.pathsep) + [gobin]:
+        if not wanted:
+            break
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    if entry.name in wanted and os.access(entry.path, os.X_OK) and not entry.is_dir():
+                        found[entry.name] = _tool_path_cache[entry.name] = entry.path
+                        wanted.discard(entry.name)
+        except OSError:
+            continue
+    return found
+
 def ensure_linux_only() -> bool:
     """Ensure the system is Linux-only and reject other platforms."""
-    if platform.system().lower() != "linux":
+    if SYSTEM_NAME != "linux":
         print(f"{Colors.RED}╔═════════════════════════════════════════════════════════════════╗{Colors.END}")
         print(f"{Colors.RED}║                               ERROR                             ║{Colors.END}")
         print(f"{Colors.RED}║                                                                 ║{Colors.END}")
@@ -152,24 +429,21 @@ def ensure_linux_only() -> bool:
 def check_root_permissions() -> bool:
     """Check for root/sudo permissions."""
     try:
-        # Method 1: Check effective user ID (Linux/Unix only)
-        try:
-            # On Windows, ctypes.CDLL(None) fails, so we need to check platform first
-            if platform.system().lower() == "linux":
-                euid = ctypes.CDLL(None).geteuid()
-                if euid == 0:
-                    print(f"{Colors.GREEN} Running with root privileges{Colors.END}")
-                    return True
-            else:
-                print(f"{Colors.YELLOW}  Not on Linux - skipping root user ID check{Colors.END}")
-        except (OSError, AttributeError) as e:
-            # Not on a Unix-like system or geteuid not available
-            print(f"{Colors.YELLOW}  Cannot check effective user ID: {e}{Colors.END}")
-          # Method 2: Check sudo access
+        # Method 1: Check effective user ID - root needs no further checks
+        if hasattr(os, 'geteuid'):
+            if os.geteuid() == 0:
+                print(f"{Colors.GREEN} Running with root privileges{Colors.END}")
+                return True
+        else:
+            print(f"{Colors.YELLOW}  Not on a Unix-like system - skipping root user ID check{Colors.END}")
+        
+        # Method 2: Check sudo access
         print(f"{Colors.YELLOW}  Not running as root. Checking sudo access...{Colors.END}")
         try:
-            result = subprocess.run(['sudo', '-n', 'true'], 
-                                  capture_output=True, check=False)
+            # -n never prompts and -v refreshes the cached credentials for the later sudo calls
+            result = subprocess.run(['sudo', '-n', '-v'], 
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                  check=False, timeout=5)
             if result.returncode == 0:
                 print(f"{Colors.GREEN} Sudo access confirmed{Colors.END}")
                 return True
@@ -177,6 +451,10 @@ def check_root_permissions() -> bool:
                 print(f"{Colors.RED} This script requires root privileges or sudo access{Colors.END}")
                 print(f"{Colors.WHITE}Please run: sudo python3 install/setup.py{Colors.END}")
                 return False
+        except subprocess.TimeoutExpired:
+            print(f"{Colors.RED} Sudo check timed out - this script requires root privileges or passwordless sudo{Colors.END}")
+            print(f"{Colors.WHITE}Please run: sudo python3 install/setup.py{Colors.END}")
+            return False
         except FileNotFoundError:
             print(f"{Colors.RED} 'sudo' command not found. This script requires sudo access on Linux{Colors.END}")
             print(f"{Colors.WHITE}Please ensure you're running on a Linux system with sudo installed{Colors.END}")
@@ -203,21 +481,32 @@ def check_internet_connectivity() -> bool:
             print(f"{Colors.YELLOW}   DNS resolution to {host}: FAILED{Colors.END}")
             continue
     
-    # Method 2: Direct socket connection to DNS servers
+    # Method 2: Direct socket connection to DNS servers, probed concurrently
     dns_servers = [
         ("8.8.8.8", 53),      # Google DNS
         ("1.1.1.1", 53),      # Cloudflare DNS
         ("9.9.9.9", 53)       # Quad9 DNS
     ]
     
-    for dns_host, dns_port in dns_servers:
-        try:
-            with socket.create_connection((dns_host, dns_port), timeout=5) as sock:
-                print(f"{Colors.GREEN}   Connection to {dns_host}:{dns_port}: SUCCESS{Colors.END}")
-                return True
-        except (socket.timeout, socket.error, OSError):
-            print(f"{Colors.YELLOW}   Connection to {dns_host}:{dns_port}: FAILED{Colors.END}")
-            continue
+    def probe(server):
+        with socket.create_connection(server, timeout=2):
+            return server
+    
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(dns_servers))
+    try:
+        futures = {executor.submit(probe, server): server for server in dns_servers}
+        for future in concurrent.futures.as_completed(futures):
+            dns_host, dns_port = futures[future]
+            try:
+                future.result()
+            except OSError:
+                print(f"{Colors.YELLOW}   Connection to {dns_host}:{dns_port}: FAILED{Colors.END}")
+                continue
+            print(f"{Colors.GREEN}   Connection to {dns_host}:{dns_port}: SUCCESS{Colors.END}")
+            return True
+    finally:
+        # Return on the first answer without waiting for slower probes
+        executor.shutdown(wait=False)
     
     # Method 3: Ping test
     ping_targets = ["8.8.8.8", "1.1.1.1"]
@@ -238,16 +527,28 @@ def check_internet_connectivity() -> bool:
             print(f"{Colors.YELLOW}   Ping to {target}: ERROR{Colors.END}")
             continue
     
-    # Method 4: HTTP connectivity test
+    # Method 4: HTTP connectivity test. Kept on urllib because it honours http(s)_proxy,
+    # which the raw TCP probes above cannot use; HEAD skips the page body
     http_urls = ["https://www.google.com", "https://github.com"]
-    for url in http_urls:
-        try:
-            urllib.request.urlopen(url, timeout=10)
+    
+    def http_probe(url):
+        with urllib.request.urlopen(urllib.request.Request(url, method='HEAD'), timeout=5):
+            return url
+    
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(http_urls))
+    try:
+        futures = {executor.submit(http_probe, url): url for url in http_urls}
+        for future in concurrent.futures.as_completed(futures):
+            url = futures[future]
+            try:
+                future.result()
+            except Exception:
+                print(f"{Colors.YELLOW}   HTTP connectivity to {url}: FAILED{Colors.END}")
+                continue
             print(f"{Colors.GREEN}   HTTP connectivity to {url}: SUCCESS{Colors.END}")
             return True
-        except Exception:
-            print(f"{Colors.YELLOW}   HTTP connectivity to {url}: FAILED{Colors.END}")
-            continue
+    finally:
+        executor.shutdown(wait=False)
     
     # All methods failed
     print(f"{Colors.RED}   All connectivity tests failed{Colors.END}")
@@ -288,8 +589,12 @@ def validate_system_requirements() -> Tuple[bool, Optional[str]]:
     
     return True, distro
 
-def run_with_timeout(cmd: List[str], timeout_seconds: int = 300, description: str = "", allow_warnings: bool = True) -> bool:
-    """Run command with timeout protection and enhanced progress indication."""
+# Serializes streamed lines from commands running on parallel threads (e.g. the Go builds)
+_output_lock = threading.Lock()
+
+def run_with_timeout(cmd: List[str], timeout_seconds: int = 300, description: str = "", allow_warnings: bool = True,
+                     env_overrides: Optional[Dict[str, str]] = None, output_tag: str = "") -> bool:
+    """Run command with timeout protection and enhanced progress indication; output_tag labels each streamed line."""
     try:
         print(f"{Colors.WHITE}{description}...{Colors.END}")
         
@@ -298,16 +603,41 @@ def run_with_timeout(cmd: List[str], timeout_seconds: int = 300, description: st
         env['DEBIAN_FRONTEND'] = 'noninteractive'
         env['NEEDRESTART_MODE'] = 'a'  # Prevent needrestart from hanging
         env['UCF_FORCE_CONFOLD'] = '1'  # Use old config files to prevent prompts
+        if env_overrides:
+            env.update(env_overrides)
         
-        # Start the process with more aggressive settings to prevent hangs
+        # Stream merged output line by line so long apt/go runs show live progress;
+        # only a bounded tail is kept for the error hints below. The pipe stays binary
+        # and lines go to the terminal as raw bytes - only the tail is ever decoded
         process = subprocess.Popen(cmd, 
-                                 stdout=subprocess.PIPE if 'Installing' in description else subprocess.DEVNULL, 
-                                 stderr=subprocess.PIPE,
+                                 stdout=subprocess.PIPE, 
+                                 stderr=subprocess.STDOUT,
                                  env=env)
         
+        # Pump output on a helper thread so the wait below keeps its timeout even
+        # if a grandchild holds the pipe open
+        tail = collections.deque(maxlen=RUN_OUTPUT_TAIL_LINES)
+        stdout_bytes = getattr(sys.stdout, 'buffer', None)
+        line_prefix = f"    [{output_tag}] " if output_tag else "    "
+        encoded_prefix = line_prefix.encode()
+        def pump_output():
+            for line in process.stdout:
+                tail.append(line)
+                with _output_lock:
+                    if stdout_bytes is None:
+                        print(f"{line_prefix}{line.decode('utf-8', 'replace').rstrip()}")
+                        continue
+                    sys.stdout.flush()  # Keep ordering with print() output still in the text layer
+                    stdout_bytes.write(encoded_prefix + line.rstrip() + b'\n')
+                    stdout_bytes.flush()
+        reader = threading.Thread(target=pump_output, daemon=True)
+        reader.start()
+        
         # Monitor progress with timeout
         try:
-            stdout, stderr = process.communicate(timeout=timeout_seconds)
+            process.wait(timeout=timeout_seconds)
+            reader.join(timeout=5)
+            output = b''.join(tail).decode('utf-8', 'replace')
             
             if process.returncode == 0:
                 print(f"{Colors.GREEN} {description} completed successfully{Colors.END}")
@@ -317,10 +647,10 @@ def run_with_timeout(cmd: List[str], timeout_seconds: int = 300, description: st
                 if 'go install' in ' '.join(cmd) or any('github.com' in arg for arg in cmd):
                     # For Go installations, any non-zero exit code is a failure
                     print(f"{Colors.RED} {description} failed (exit code: {process.returncode}){Colors.END}")
-                    if stderr:
-                        error_msg = stderr.decode().strip()
+                    if output:
+                        error_msg = output.strip()
                         if error_msg:
-                            print(f"{Colors.RED}  Error details: {error_msg[:300]}{Colors.END}")
+                            print(f"{Colors.RED}  Error details: {error_msg[-300:]}{Colors.END}")
                             
                             # Provide specific guidance for common Go installation errors
                             if 'no such file or directory' in error_msg.lower():
@@ -335,17 +665,17 @@ def run_with_timeout(cmd: List[str], timeout_seconds: int = 300, description: st
                 elif allow_warnings:
                     # For package operations, warnings may be acceptable
                     print(f"{Colors.YELLOW} {description} completed with warnings (exit code: {process.returncode}){Colors.END}")
-                    if stderr:
-                        error_msg = stderr.decode().strip()
+                    if output:
+                        error_msg = output.strip()
                         if error_msg and "error" in error_msg.lower():
-                            print(f"{Colors.YELLOW}  Warning: {error_msg[:200]}{Colors.END}")
+                            print(f"{Colors.YELLOW}  Warning: {error_msg[-200:]}{Colors.END}")
                     return True  # Continue on warnings for most package operations
                 else:
                     print(f"{Colors.RED} {description} failed (exit code: {process.returncode}){Colors.END}")
-                    if stderr:
-                        error_msg = stderr.decode().strip()
+                    if output:
+                        error_msg = output.strip()
                         if error_msg:
-                            print(f"{Colors.RED}  Error: {error_msg[:200]}{Colors.END}")
+                            print(f"{Colors.RED}  Error: {error_msg[-200:]}{Colors.END}")
                     return False
                 
         except subprocess.TimeoutExpired:
@@ -363,18 +693,137 @@ def run_with_timeout(cmd: List[str], timeout_seconds: int = 300, description: st
         print(f"{Colors.RED} {description} failed: {e}{Colors.END}")
         return False
 
+# A failed apt run is retried while another package manager (e.g. unattended-upgrades)
+# still holds the dpkg lock, waiting APT_LOCK_BACKOFF seconds and doubling each time
+APT_LOCK_RETRIES = 3
+APT_LOCK_BACKOFF = 5.0
+
+def apt_install(packages: List[str], timeout_seconds: int = 180, description: str = "",
+                extra_args: Optional[List[str]] = None, allow_warnings: bool = True) -> bool:
+    """Install Debian packages non-interactively through run_with_timeout, waiting out a held apt lock."""
+    cmd = ['apt', 'install', '-y'] + (extra_args or []) + packages
+    description = description or f"Installing {', '.join(packages)}"
+    # Judge each attempt by its real exit status: with warnings allowed, run_with_timeout
+    # would report a lock failure as success and it would never be retried
+    for attempt in range(APT_LOCK_RETRIES + 1):
+        if run_with_timeout(cmd, timeout_seconds, description, allow_warnings=False):
+            return True
+        if attempt == APT_LOCK_RETRIES or not find_processes_by_name(PACKAGE_MANAGER_PROCESSES):
+            break
+        delay = APT_LOCK_BACKOFF * (2 ** attempt)
+        print(f"{Colors.YELLOW} Another package manager holds the apt lock - retrying in {delay:.0f}s{Colors.END}")
+        time.sleep(delay)
+    # Only now apply the caller's policy of treating a failed package operation as a warning
+    if allow_warnings:
+        print(f"{Colors.YELLOW} Continuing despite errors in: {description}{Colors.END}")
+        return True
+    return False
+
+def apt_install_batch(packages: List[str], timeout_per_package: int = 120) -> bool:
+    """Install packages in one apt transaction, retrying one by one only if the batch fails."""
+    if apt_install(packages, timeout_per_package * len(packages), allow_warnings=False):
+        return True
+    print(f"{Colors.YELLOW} Batch installation failed, installing packages individually...{Colors.END}")
+    # Strict per package too, so the result says whether every package actually made it
+    return all([apt_install([package], timeout_per_package, allow_warnings=False) for package in packages])
+
+def go_build_env(goproxy: str = 'https://proxy.golang.org,direct') -> Dict[str, str]:
+    """Environment overrides shared by every go install the installer runs."""
+    return {'CGO_ENABLED': '1', 'GO111MODULE': 'on', 'GOPROXY': goproxy}
+
+def go_install_cmd(repo: str) -> List[str]:
+    """go install argv; -ldflags goes on the command line because GOFLAGS cannot hold '-s -w'."""
+    return ['go', 'install', '-v', '-trimpath', f'-ldflags={GO_LDFLAGS}', repo]
+
+def go_install(repo: str, timeout_seconds: int, description: str, goproxy: Optional[str] = None,
+               tool: str = "") -> bool:
+    """Build a Go tool with go install; any non-zero exit is a failure. Output lines are tagged with tool."""
+    env_overrides = go_build_env(goproxy=goproxy) if goproxy else go_build_env()
+    return run_with_timeout(go_install_cmd(repo), timeout_seconds, description, allow_warnings=False,
+                            env_overrides=env_overrides, output_tag=tool)
+
+_package_state_repaired = False
+_package_index_refreshed = False
+
+def refresh_package_index(update_cmd: Optional[List[str]] = None, timeout_seconds: int = 300) -> bool:
+    """Refresh the package lists once per installer run; later callers reuse that refresh."""
+    global _package_index_refreshed
+    if not _package_index_refreshed:
+        _package_index_refreshed = run_with_timeout(update_cmd or ['apt', 'update'], timeout_seconds, "Repository update")
+    return _package_index_refreshed
+
+def dpkg_needs_repair() -> bool:
+    """Check for an interrupted dpkg run or half-configured packages without changing anything."""
+    try:
+        # dpkg journals in-progress work here; it is empty after a clean run
+        if os.listdir('/var/lib/dpkg/updates'):
+            return True
+    except OSError:
+        pass
+    try:
+        audit = subprocess.run(['dpkg', '--audit'], stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return True  # Cannot tell - assume the repair is needed
+    return audit.returncode != 0 or bool(audit.stdout.strip())
+
+def repair_package_state() -> None:
+    """Finish interrupted dpkg runs and fix broken apt dependencies, once per installer run."""
+    global _package_state_repaired
+    if _package_state_repaired:
+        return
+    if not dpkg_needs_repair():
+        print(f"{Colors.GREEN} Package database is consistent - skipping repair{Colors.END}")
+        _package_state_repaired = True
+        return
+    run_with_timeout(['dpkg', '--configure', '-a'], 240, "Configuring packages (extended timeout)")
+    run_with_timeout(['apt', '--fix-broken', 'install', '-y'], 360, "Fixing broken packages (extended timeout)")
+    _package_state_repaired = True
+
+# Processes that can hold the apt/dpkg locks, as /proc/<pid>/comm shows them
+# (the kernel truncates comm to 15 characters: unattended-upgrade -> unattended-upgr)
+PACKAGE_MANAGER_PROCESSES = frozenset({'apt', 'apt-get', 'aptitude', 'dpkg', 'unattended-upgr', 'needrestart'})
+
+def find_processes_by_name(names: frozenset) -> List[int]:
+    """PIDs of every other process whose command name is in names, from one walk over /proc."""
+    pids = []
+    own_pid = os.getpid()
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return pids
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit() or int(entry.name) == own_pid:
+                continue
+            try:
+                with open(f'/proc/{entry.name}/comm') as f:
+                    if f.read().rstrip('\n') in names:
+                        pids.append(int(entry.name))
+            except OSError:
+                continue  # Exited meanwhile
+    return pids
+
+def kill_processes_by_name(names: frozenset) -> int:
+    """SIGKILL every process whose command name is in names; returns how many were killed."""
+    killed = 0
+    for pid in find_processes_by_name(names):
+        try:
+            os.kill(pid, signal.SIGKILL)
+            killed += 1
+        except OSError:
+            continue  # Exited meanwhile, or not ours to kill
+    return killed
+
 def fix_package_locks() -> bool:
     """Fix common package manager lock issues with enhanced safety and longer timeouts."""
     print(f"{Colors.WHITE}Checking and fixing package locks...{Colors.END}")
     
     # Kill any hanging processes with more aggressive approach
     try:
-        # Kill specific hanging processes
-        subprocess.run(['pkill', '-9', '-f', 'apt'], capture_output=True, timeout=10)
-        subprocess.run(['pkill', '-9', '-f', 'dpkg'], capture_output=True, timeout=10)
-        subprocess.run(['pkill', '-9', '-f', 'unattended-upgrade'], capture_output=True, timeout=10)
-        subprocess.run(['pkill', '-9', '-f', 'needrestart'], capture_output=True, timeout=10)
-        time.sleep(3)  # Wait longer for processes to terminate
+        # Kill specific hanging processes - one in-process /proc walk instead of pkill
+        if kill_processes_by_name(PACKAGE_MANAGER_PROCESSES):
+            time.sleep(3)  # Wait longer for processes to terminate
     except:
         pass
     
@@ -397,11 +846,21 @@ def fix_package_locks() -> bool:
     if locks_removed > 0:
         print(f"{Colors.GREEN} Removed {locks_removed} package locks{Colors.END}")
         # Fix broken packages with extended timeouts
-        run_with_timeout(['dpkg', '--configure', '-a'], 240, "Configuring packages (extended timeout)")
-        run_with_timeout(['apt', '--fix-broken', 'install', '-y'], 360, "Fixing broken packages (extended timeout)")
+        repair_package_state()
     
     return True
 
+# Replacement sources.list written by fix_kali_repositories
+KALI_SOURCES_LIST = """
+# Official Kali repositories
+deb http://http.kali.org/kali kali-rolling main non-free contrib
+deb-src http://http.kali.org/kali kali-rolling main non-free contrib
+
+# Additional mirrors for redundancy
+deb http://mirror.truenetwork.ru/kali kali-rolling main non-free contrib
+deb http://kali.download/kali kali-rolling main non-free contrib
+"""
+
 def fix_kali_repositories() -> bool:
     """Fix Kali Linux repository issues by updating sources."""
     try:
@@ -412,18 +871,7 @@ def fix_kali_repositories() -> bool:
                       capture_output=True)
         
         # Add reliable Kali mirrors
-        kali_sources = """
-# Official Kali repositories
-deb http://http.kali.org/kali kali-rolling main non-free contrib
-deb-src http://http.kali.org/kali kali-rolling main non-free contrib
-
-# Additional mirrors for redundancy
-deb http://mirror.truenetwork.ru/kali kali-rolling main non-free contrib
-deb http://kali.download/kali kali-rolling main non-free contrib
-"""
-        
-        with open('/etc/apt/sources.list', 'w') as f:
-            f.write(kali_sources)
+        Path('/etc/apt/sources.list').write_text(KALI_SOURCES_LIST)
         
         print(f"{Colors.GREEN} Updated Kali repositories with reliable mirrors{Colors.END}")
         
@@ -446,14 +894,13 @@ def install_libpcap_alternative() -> bool:
         print(f"{Colors.WHITE}Attempting alternative libpcap-dev installation...{Colors.END}")
         
         # Method 1: Try with --fix-missing
-        if run_with_timeout(['apt', 'install', 'libpcap-dev', '--fix-missing', '-y'], 180, "Installing libpcap-dev with --fix-missing"):
+        if apt_install(['libpcap-dev'], 180, "Installing libpcap-dev with --fix-missing", ['--fix-missing']):
             return True
         
-        # Method 2: Try individual component packages
+        # Method 2: Try the component packages together
         libpcap_packages = ['libpcap0.8-dev', 'libpcap-dev']
-        for package in libpcap_packages:
-            if run_with_timeout(['apt', 'install', package, '-y'], 120, f"Installing {package}"):
-                return True
+        if apt_install_batch(libpcap_packages):
+            return True
         
         # Method 3: Try downloading and installing manually with correct URLs
         print(f"{Colors.WHITE}Attempting manual libpcap-dev download...{Colors.END}")
@@ -486,9 +933,9 @@ def install_libpcap_alternative() -> bool:
         # Method 4: Try installing from universe repository (for Ubuntu/Debian derivatives)
         print(f"{Colors.WHITE}Trying alternative repository sources...{Colors.END}")
         try:
-            # Add universe repository if it doesn't exist
-            result = subprocess.run(['apt', 'update'], capture_output=True)
-            if run_with_timeout(['apt', 'install', 'libpcap-dev', '--install-suggests', '-y'], 180, "Installing with suggests"):
+            # Package lists are normally fresh from Phase 1 already
+            refresh_package_index()
+            if apt_install(['libpcap-dev'], 180, "Installing with suggests", ['--install-suggests']):
                 return True
         except:
             pass
@@ -496,14 +943,22 @@ def install_libpcap_alternative() -> bool:
         # Method 5: Build from source as last resort
         print(f"{Colors.WHITE}Attempting to build libpcap from source...{Colors.END}")
         try:
-            # Install build dependencies first
-            build_deps = ['build-essential', 'flex', 'bison']
-            for dep in build_deps:
-                run_with_timeout(['apt', 'install', dep, '-y'], 120, f"Installing {dep}")
+            # Stream the source straight into /tmp in the background while apt installs
+            # the build dependencies - no wget, no tar process and no tarball on disk
+            print(f"{Colors.WHITE}Downloading libpcap source...{Colors.END}")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                download = executor.submit(stream_extract_tarball, 'https://www.tcpdump.org/release/libpcap-1.10.4.tar.gz', '/tmp', None, False)
+                build_deps = ['build-essential', 'flex', 'bison']
+                apt_install_batch(build_deps)
+                try:
+                    download.result()
+                    source_downloaded = True
+                except (OSError, tarfile.TarError) as e:
+                    print(f"{Colors.YELLOW} libpcap source download failed: {e}{Colors.END}")
+                    source_downloaded = False
             
-            # Download and build libpcap
-            if run_with_timeout(['wget', '-q', 'https://www.tcpdump.org/release/libpcap-1.10.4.tar.gz', '-O', '/tmp/libpcap.tar.gz'], 120, "Downloading libpcap source"):
-                subprocess.run(['tar', '-xzf', '/tmp/libpcap.tar.gz', '-C', '/tmp/'], check=True)
+            # Build libpcap
+            if source_downloaded:
                 libpcap_dir = '/tmp/libpcap-1.10.4'
                 if os.path.exists(libpcap_dir):
                     # Configure, compile and install
@@ -532,7 +987,7 @@ def install_system_packages(distro_config: Dict) -> bool:
 
         # Phase 1b: Repository update with timeout protection
         print(f"{Colors.WHITE}Updating package repository (timeout: 300s)...{Colors.END}")
-        if not run_with_timeout(distro_config['update_cmd'], 300, "Repository update"):
+        if not refresh_package_index(distro_config['update_cmd'], 300):
             print(f"{Colors.YELLOW} Repository update failed, trying recovery...{Colors.END}")
 
             # Try Kali-specific repository fixes
@@ -573,11 +1028,22 @@ def install_system_packages(distro_config: Dict) -> bool:
 
         # Initialize success counter
         success_count = 0
-        total_packages = len(essential_packages)        # Install essential packages with non-interactive mode for safety
-        for package in essential_packages:
+        total_packages = len(essential_packages)
+        
+        # Install all essential packages in one apt transaction so apt resolves them
+        # together and its fetcher downloads them in parallel
+        if apt_install(essential_packages, 180 * total_packages, extra_args=APT_PARALLEL_FETCH_OPTIONS, allow_warnings=False):
+            success_count = total_packages
+            pending_packages = []
+        else:
+            print(f"{Colors.YELLOW} Batch installation failed, installing packages individually...{Colors.END}")
+            pending_packages = essential_packages
+        
+        # Fall back to one package at a time with non-interactive mode for safety
+        for package in pending_packages:
             if package == 'libpcap-dev':
                 # Special handling for libpcap-dev
-                if run_with_timeout(['env', 'DEBIAN_FRONTEND=noninteractive', 'apt', 'install', package, '-y'], 180, f"Installing {package}"):
+                if apt_install([package]):
                     success_count += 1
                 else:
                     print(f"{Colors.YELLOW} {package} standard installation failed, trying alternatives...{Colors.END}")
@@ -587,7 +1053,7 @@ def install_system_packages(distro_config: Dict) -> bool:
                     else:
                         print(f"{Colors.RED} {package} installation failed completely{Colors.END}")
             else:
-                if run_with_timeout(['env', 'DEBIAN_FRONTEND=noninteractive', 'apt', 'install', package, '-y'], 180, f"Installing {package}"):
+                if apt_install([package]):
                     success_count += 1
                 else:
                     print(f"{Colors.YELLOW} {package} failed, but continuing...{Colors.END}")
@@ -613,39 +1079,34 @@ def setup_go_environment_complete() -> bool:
         print(f"\n{Colors.BLUE} Phase 2: Go Environment Setup{Colors.END}")
         
         # Check if Go is already properly installed
-        go_installed = False
-        try:
-            result = subprocess.run(['go', 'version'], 
-                                  capture_output=True, text=True, check=True)
-            version = result.stdout.strip()
-            print(f"{Colors.GREEN} Go already installed: {version}{Colors.END}")
-            go_installed = True
-            
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        go_installed = _have('go')
+        if go_installed:
+            print(f"{Colors.GREEN} Go already installed: {locate_tool('go')}{Colors.END}")
+        else:
             print(f"{Colors.YELLOW}  Go not found or improperly configured{Colors.END}")
         
         # Install/configure Go manually if needed
         if not go_installed:
             print(f"{Colors.WHITE}Installing Go manually...{Colors.END}")
             go_version = "1.21.5"
-            go_archive = f"go{go_version}.linux-amd64.tar.gz"
+            go_archive = f"go{go_version}.linux-{GO_ARCH}.tar.gz"
             
             try:
-                # Download Go
-                subprocess.run([
-                    'wget', '-q', 
-                    f'https://golang.org/dl/{go_archive}',
-                    '-O', f'/tmp/{go_archive}'
-                ], check=True)
+                go_url = f'https://golang.org/dl/{go_archive}'
+                expected_sha256 = fetch_published_sha256(go_url) or go_release_sha256(go_archive)
+                if not expected_sha256:
+                    print(f"{Colors.YELLOW}  Could not fetch the published Go checksum - archive will not be verified{Colors.END}")
                 
-                # Extract Go
-                subprocess.run(['sudo', 'tar', '-C', '/usr/local', '-xzf', f'/tmp/{go_archive}'], check=True)
+                # Download, hash and extract Go in one stream. The new tree is staged next to
+                # /usr/local/go and only swapped in once verified, so a failed or tampered
+                # download never leaves a truncated toolchain on PATH
+                stream_extract_tarball(go_url, '/usr/local', expected_sha256)
+                if expected_sha256:
+                    print(f"{Colors.GREEN} Go archive checksum verified{Colors.END}")
                 
                 # Set up Go binary path
                 go_bin = '/usr/local/go/bin'
-                current_path = os.environ.get('PATH', '')
-                if go_bin not in current_path:
-                    os.environ['PATH'] = f"{go_bin}:{current_path}"
+                if prepend_to_path(go_bin):
                     print(f"{Colors.GREEN} Added {go_bin} to PATH{Colors.END}")
                 
                 # Verify Go installation worked
@@ -654,7 +1115,7 @@ def setup_go_environment_complete() -> bool:
                 version = result.stdout.strip()
                 print(f"{Colors.GREEN} Go installed successfully: {version}{Colors.END}")
                 
-            except subprocess.CalledProcessError as e:
+            except (subprocess.CalledProcessError, tarfile.TarError, OSError, ValueError) as e:
                 print(f"{Colors.RED} Failed to install Go: {e}{Colors.END}")
                 return False
         
@@ -667,7 +1128,7 @@ def setup_go_environment_complete() -> bool:
             
             if not gopath:
                 # Set default GOPATH if not set
-                gopath = os.path.expanduser('~/go')
+                gopath = os.path.join(HOME_DIR, 'go')
                 print(f"{Colors.WHITE}Setting GOPATH to default: {gopath}{Colors.END}")
             
             print(f"{Colors.WHITE}GOPATH: {gopath}{Colors.END}")
@@ -677,9 +1138,13 @@ def setup_go_environment_complete() -> bool:
                 os.makedirs(gopath, exist_ok=True)
                 print(f"{Colors.GREEN} Created GOPATH directory: {gopath}{Colors.END}")
             
+            # One directory read answers whether bin/ and src/ exist, instead of a stat per path
+            with os.scandir(gopath) as entries:
+                existing_dirs = {entry.name for entry in entries if entry.is_dir()}
+            
             # Ensure GOPATH/bin directory exists (CRITICAL FIX)
             gobin = os.path.join(gopath, 'bin')
-            if not os.path.exists(gobin):
+            if 'bin' not in existing_dirs:
                 os.makedirs(gobin, exist_ok=True)
                 print(f"{Colors.GREEN} Created GOBIN directory: {gobin}{Colors.END}")
             else:
@@ -687,20 +1152,17 @@ def setup_go_environment_complete() -> bool:
             
             # Ensure GOPATH/src directory exists (for older Go versions)
             gosrc = os.path.join(gopath, 'src')
-            if not os.path.exists(gosrc):
+            if 'src' not in existing_dirs:
                 os.makedirs(gosrc, exist_ok=True)
                 print(f"{Colors.GREEN} Created GOSRC directory: {gosrc}{Colors.END}")
             
             # Set proper permissions on Go directories
             import stat
             for go_dir in [gopath, gobin, gosrc]:
-                if os.path.exists(go_dir):
-                    os.chmod(go_dir, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+                os.chmod(go_dir, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
             
             # Ensure GOBIN is in PATH for current session (CRITICAL FIX)
-            current_path = os.environ.get('PATH', '')
-            if gobin not in current_path:
-                os.environ['PATH'] = f"{gobin}:{current_path}"
+            if prepend_to_path(gobin):
                 print(f"{Colors.GREEN} Added {gobin} to current session PATH{Colors.END}")
             else:
                 print(f"{Colors.GREEN} {gobin} already in PATH{Colors.END}")
@@ -717,36 +1179,27 @@ def setup_go_environment_complete() -> bool:
                 'export PATH=$PATH:$GOBIN'
             ]
             
-            for profile in ['.bashrc', '.zshrc']:
-                profile_path = os.path.expanduser(f'~/{profile}')
-                if os.path.exists(profile_path):
-                    # Check if Go environment is already configured
-                    with open(profile_path, 'r') as f:
-                        content = f.read()
-                    
-                    if '# Go environment' not in content:
-                        with open(profile_path, 'a') as f:
-                            f.write('\n# Go environment\n')
-                            for line in profile_lines:
-                                f.write(f'{line}\n')
-                        print(f"{Colors.GREEN} Added Go environment to {profile}{Colors.END}")
+            for profile_path in update_shell_profiles('# Go environment', profile_lines):
+                print(f"{Colors.GREEN} Added Go environment to {os.path.basename(profile_path)}{Colors.END}")
             
             # Final validation
             print(f"{Colors.WHITE}Validating Go environment...{Colors.END}")
             
             # Test Go command
-            subprocess.run(['go', 'version'], check=True, capture_output=True)
+            if not _have('go'):
+                print(f"{Colors.RED}   Go command not found in PATH{Colors.END}")
+                return False
             print(f"{Colors.GREEN}   Go command working{Colors.END}")
             
             # Test GOPATH
-            if os.path.exists(gopath) and os.path.isdir(gopath):
+            if os.path.isdir(gopath):
                 print(f"{Colors.GREEN}   GOPATH directory accessible{Colors.END}")
             else:
                 print(f"{Colors.RED}   GOPATH directory issue{Colors.END}")
                 return False
             
             # Test GOBIN
-            if os.path.exists(gobin) and os.path.isdir(gobin):
+            if os.path.isdir(gobin):
                 print(f"{Colors.GREEN}   GOBIN directory accessible{Colors.END}")
             else:
                 print(f"{Colors.RED}   GOBIN directory issue{Colors.END}")
@@ -774,6 +1227,22 @@ def setup_go_environment_complete() -> bool:
         print(f"{Colors.RED} Go environment setup failed: {e}{Colors.END}")
         return False
 
+def installed_packages(distro: str) -> Set[str]:
+    """Names of every installed package, from one package database query."""
+    if distro == 'arch':
+        cmd = ['pacman', '-Qq']
+    else:
+        # dpkg keeps removed-but-not-purged packages in its database; only count installed ones
+        cmd = ['dpkg-query', '-W', '-f=${Status} ${Package}\n']
+    try:
+        output = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return set()
+    if distro == 'arch':
+        return set(output.split())
+    return {line.rsplit(' ', 1)[1] for line in output.splitlines()
+            if line.startswith('install ok installed ')}
+
 def check_system_dependencies(distro: str) -> bool:
     """Check and install required system dependencies before Go tools installation."""
     try:
@@ -797,30 +1266,14 @@ def check_system_dependencies(distro: str) -> bool:
         
         print(f"{Colors.WHITE}Checking dependencies for {distro_config['name']}...{Colors.END}")
         
-        # Check each dependency
+        # One package database query answers every dependency
+        installed = installed_packages(distro)
         for dep in required_deps:
-            if distro == 'arch':
-                # Use pacman for Arch Linux
-                try:
-                    result = subprocess.run(['pacman', '-Q', dep], 
-                                          capture_output=True, check=True)
-                    print(f"{Colors.GREEN}   {dep} is installed{Colors.END}")
-                except subprocess.CalledProcessError:
-                    print(f"{Colors.RED}   {dep} is missing{Colors.END}")
-                    missing_deps.append(dep)
+            if dep in installed:
+                print(f"{Colors.GREEN}   {dep} is installed{Colors.END}")
             else:
-                # Use dpkg for Debian-based systems
-                try:
-                    result = subprocess.run(['dpkg', '-l', dep], 
-                                          capture_output=True, check=True)
-                    if result.returncode == 0:
-                        print(f"{Colors.GREEN}   {dep} is installed{Colors.END}")
-                    else:
-                        print(f"{Colors.RED}   {dep} is missing{Colors.END}")
-                        missing_deps.append(dep)
-                except subprocess.CalledProcessError:
-                    print(f"{Colors.RED}   {dep} is missing{Colors.END}")
-                    missing_deps.append(dep)
+                print(f"{Colors.RED}   {dep} is missing{Colors.END}")
+                missing_deps.append(dep)
         
         # Install missing dependencies automatically
         if missing_deps:
@@ -844,8 +1297,9 @@ def check_system_dependencies(distro: str) -> bool:
                 print(f"{Colors.YELLOW}Please install manually: {' '.join(missing_deps)}{Colors.END}")
                 return False
         
-        # Check for broken packages
-        run_with_timeout(['apt', '--fix-broken', 'install', '-y'], 180, "Fixing broken packages")
+        # Check for broken packages (skipped if the lock cleanup already repaired them)
+        if distro != 'arch':
+            repair_package_state()
         
         return True
         
@@ -853,36 +1307,43 @@ def check_system_dependencies(distro: str) -> bool:
         print(f"{Colors.RED} Dependency verification failed: {e}{Colors.END}")
         return False
 
+PCAP_HEADER_PATTERNS = [
+    '/usr/include/pcap.h',
+    '/usr/local/include/pcap.h',
+    '/usr/include/pcap/pcap.h',
+    '/usr/include/x86_64-linux-gnu/pcap.h',
+    '/usr/include/*/pcap.h'
+]
+
+def find_pcap_header() -> Optional[str]:
+    """Return the first pcap.h found in the usual include locations."""
+    import glob
+    for header in PCAP_HEADER_PATTERNS:
+        matches = glob.glob(header) if '*' in header else [header] if os.path.exists(header) else []
+        if matches:
+            return matches[0]
+    return None
+
+def available_apt_packages(candidates: List[str]) -> Optional[List[str]]:
+    """Return the candidates apt knows about, or None if apt-cache cannot be queried."""
+    try:
+        result = subprocess.run(['apt-cache', 'pkgnames'], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, timeout=30, check=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    known = set(result.stdout.split())
+    return [package for package in candidates if package in known]
+
 def verify_go_tools_prerequisites() -> bool:
     """Verify prerequisites for Go tools compilation."""
     try:
         print(f"{Colors.WHITE}Verifying Go tools prerequisites...{Colors.END}")
         
         # Enhanced pcap.h header search with more locations
-        pcap_headers = [
-            '/usr/include/pcap.h',
-            '/usr/local/include/pcap.h',
-            '/usr/include/pcap/pcap.h',
-            '/usr/include/x86_64-linux-gnu/pcap.h',
-            '/usr/include/*/pcap.h'
-        ]
-        
-        pcap_found = False
-        for header in pcap_headers:
-            if '*' in header:
-                # Use glob for wildcard patterns
-                import glob
-                matches = glob.glob(header)
-                if matches:
-                    print(f"{Colors.GREEN}   pcap.h found at {matches[0]}{Colors.END}")
-                    pcap_found = True
-                    break
-            elif os.path.exists(header):
-                print(f"{Colors.GREEN}   pcap.h found at {header}{Colors.END}")
-                pcap_found = True
-                break
-        
-        if not pcap_found:
+        pcap_header = find_pcap_header()
+        if pcap_header:
+            print(f"{Colors.GREEN}   pcap.h found at {pcap_header}{Colors.END}")
+        else:
             print(f"{Colors.YELLOW}   pcap.h header not found in standard locations{Colors.END}")
             
             # Try to install missing libpcap packages
@@ -896,25 +1357,22 @@ def verify_go_tools_prerequisites() -> bool:
                 'pcap-devel'
             ]
             
-            for variant in libpcap_variants:
-                if run_with_timeout(['apt', 'install', variant, '-y'], 120, f"Installing {variant}"):
-                    # Check again after installation
-                    for header in pcap_headers:
-                        if '*' in header:
-                            import glob
-                            matches = glob.glob(header)
-                            if matches:
-                                print(f"{Colors.GREEN}   pcap.h now found at {matches[0]}{Colors.END}")
-                                pcap_found = True
-                                break
-                        elif os.path.exists(header):
-                            print(f"{Colors.GREEN}   pcap.h now found at {header}{Colors.END}")
-                            pcap_found = True
+            # Ask apt which variants exist on this distro and install those in one transaction;
+            # fall back to trying each name only if the package list cannot be read
+            available = available_apt_packages(libpcap_variants)
+            if available is None:
+                for variant in libpcap_variants:
+                    if apt_install([variant], 120):
+                        pcap_header = find_pcap_header()
+                        if pcap_header:
                             break
-                    if pcap_found:
-                        break
+            elif available:
+                if apt_install(available, 180):
+                    pcap_header = find_pcap_header()
             
-            if not pcap_found:
+            if pcap_header:
+                print(f"{Colors.GREEN}   pcap.h now found at {pcap_header}{Colors.END}")
+            else:
                 print(f"{Colors.RED}   Could not install or locate pcap.h{Colors.END}")
                 print(f"{Colors.YELLOW}   naabu compilation may fail without pcap headers{Colors.END}")
                 # Don't fail completely - let Go tools try anyway
@@ -952,14 +1410,12 @@ def attempt_dependency_recovery(distro: str) -> bool:
             print(f"{Colors.WHITE}Cleaning apt cache and updating...{Colors.END}")
             subprocess.run(['env', 'DEBIAN_FRONTEND=noninteractive', 'apt-get', 'clean'], 
                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            subprocess.run(['env', 'DEBIAN_FRONTEND=noninteractive', 'apt-get', 'update'], check=True,
-                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            refresh_package_index()
         
-        # Try to fix broken packages
+        # Try to fix broken packages (shared with the lock cleanup, so it runs at most once)
         if distro != 'arch':
             print(f"{Colors.WHITE}Fixing broken packages...{Colors.END}")
-            subprocess.run(['env', 'DEBIAN_FRONTEND=noninteractive', 'NEEDRESTART_MODE=a', 'apt-get', 'install', '-f', '-y'], 
-                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            repair_package_state()
         
         # Retry dependency installation
         print(f"{Colors.WHITE}Retrying dependency installation...{Colors.END}")
@@ -978,153 +1434,221 @@ def clean_go_mod_cache():
     except Exception as e:
         print(f"{Colors.YELLOW}   Could not clean Go module cache: {e}{Colors.END}")
 
-def install_nuclei_with_retries(repo, max_retries=3):
-    """Try to install nuclei with retries, cleaning cache and switching proxy if needed."""
+NUCLEI_VERSION = "v3.1.5"  # Latest stable release
+# Where nuclei keeps its templates (v3 default first, then older releases)
+NUCLEI_TEMPLATE_DIRS = [
+    os.path.join(HOME_DIR, 'nuclei-templates'),
+    os.path.join(HOME_DIR, '.local', 'nuclei-templates'),
+]
+NUCLEI_TEMPLATE_MAX_AGE = 86400  # Templates refreshed within a day are reused as-is
+
+def install_nuclei_attempt(repo: str, attempt: int, max_retries: int = 3) -> bool:
+    """Run one nuclei go install; retries (attempt >= 2) clean the module cache and bypass the proxy."""
     # Use a specific nuclei version tag instead of latest to reduce dependency bloat
     # Extract the repo name without version tag
-    base_repo = repo.split('@')[0]
-    specific_version = "v3.1.5"  # Latest stable release
-    specific_repo = f"{base_repo}@{specific_version}"
+    specific_repo = f"{repo.split('@')[0]}@{NUCLEI_VERSION}"
     
-    print(f"{Colors.WHITE}Installing nuclei {specific_version} (with reduced dependencies)...{Colors.END}")
+    # On 2nd+ attempt, switch to direct proxy
+    goproxy = None
+    if attempt >= 2:
+        goproxy = 'direct'
+        print(f"{Colors.YELLOW}  Using GOPROXY=direct for retry{Colors.END}")
+    # On 2nd+ attempt, clean cache
+    if attempt >= 2:
+        clean_go_mod_cache()
+    timeout_seconds = 600  # 10 min
     
-    for attempt in range(1, max_retries+1):
-        print(f"{Colors.WHITE}Installing nuclei (attempt {attempt}/{max_retries})...{Colors.END}")
-        env = os.environ.copy()
-        env['CGO_ENABLED'] = '1'
-        env['GO111MODULE'] = 'on'
-        # Fix the GOFLAGS format - there was a syntax error with the quotes
-        env['GOFLAGS'] = '-ldflags=-s -w'  # Correct format without nested quotes
-        
-        # On 2nd+ attempt, switch to direct proxy
-        if attempt >= 2:
-            env['GOPROXY'] = 'direct'
-            print(f"{Colors.YELLOW}  Using GOPROXY=direct for retry{Colors.END}")
-        else:
-            env['GOPROXY'] = 'https://proxy.golang.org,direct'
-        # On 2nd+ attempt, clean cache
-        if attempt >= 2:
-            clean_go_mod_cache()
-        timeout_seconds = 600  # 10 min
-        
-        # Use -trimpath to remove local paths from binary
-        result = subprocess.run(['go', 'install', '-v', '-trimpath', specific_repo], 
-                               capture_output=True, text=True, env=env, timeout=timeout_seconds)
-        
-        if result.returncode == 0:
-            print(f"{Colors.GREEN}   nuclei v{specific_version} installed successfully (reduced dependencies){Colors.END}")
+    # Streams go's output live and keeps only a bounded tail for the error report,
+    # instead of buffering the whole -v build log of nuclei's dependency tree
+    if go_install(specific_repo, timeout_seconds,
+                  f"Installing nuclei {NUCLEI_VERSION} (attempt {attempt}/{max_retries})", goproxy=goproxy,
+                  tool='nuclei'):
+        print(f"{Colors.GREEN}   nuclei {NUCLEI_VERSION} installed successfully (reduced dependencies){Colors.END}")
+        return True
+    return False
+
+def install_nuclei_with_retries(repo, max_retries=3, start_attempt=1):
+    """Try to install nuclei with retries, cleaning cache and switching proxy if needed."""
+    for attempt in range(start_attempt, max_retries+1):
+        if install_nuclei_attempt(repo, attempt, max_retries):
             return True
-        else:
-            print(f"{Colors.RED}   nuclei install failed (exit {result.returncode}){Colors.END}")
-            print(f"{Colors.YELLOW}  --- go install output ---{Colors.END}")
-            print(result.stdout[-1000:])
-            print(result.stderr[-1000:])
-            if attempt == max_retries:
-                print(f"{Colors.RED}   nuclei installation failed after {max_retries} attempts{Colors.END}")
-                return False
+        if attempt < max_retries:
             print(f"{Colors.YELLOW}  Retrying nuclei installation...{Colors.END}")
+    print(f"{Colors.RED}   nuclei installation failed after {max_retries} attempts{Colors.END}")
     return False
 
+def install_go_tool(tool: str, repo: str, timeout_seconds: int) -> str:
+    """Install a single Go tool. Returns 'present', 'installed' or 'failed'."""
+    try:
+        print(f"{Colors.WHITE}Installing {tool}...{Colors.END}")
+        if _have(tool):
+            print(f"{Colors.GREEN}   {tool} already installed{Colors.END}")
+            return 'present'
+        if go_install(repo, timeout_seconds, f"Installing {tool} (timeout: {timeout_seconds//60}min)", tool=tool):
+            return 'installed'
+        print(f"{Colors.RED}   {tool} installation failed via go install{Colors.END}")
+    except Exception as e:
+        print(f"{Colors.RED}   Failed to install {tool}: {e}{Colors.END}")
+    return 'failed'
+
+def nuclei_templates_recent() -> bool:
+    """Check whether a nuclei templates directory was updated within NUCLEI_TEMPLATE_MAX_AGE."""
+    now = time.time()
+    for template_dir in NUCLEI_TEMPLATE_DIRS:
+        try:
+            if now - os.path.getmtime(template_dir) < NUCLEI_TEMPLATE_MAX_AGE:
+                return True
+        except OSError:
+            continue
+    return False
+
+def update_nuclei_templates() -> None:
+    """Refresh nuclei templates; failures are reported but never fatal."""
+    if nuclei_templates_recent():
+        print(f"{Colors.GREEN} Nuclei templates updated within the last 24h - skipping download{Colors.END}")
+        return
+    print(f"{Colors.WHITE}Updating nuclei templates (optimized)...{Colors.END}")
+    try:
+        # Use non-interactive mode and extended timeout for template updates
+        env = os.environ.copy()
+        env['DEBIAN_FRONTEND'] = 'noninteractive'
+        env['NUCLEI_DISABLE_COLORS'] = 'true'  # Prevent color codes from hanging terminal
+
+        # Run with extended timeout and silent mode for faster processing
+        result = subprocess.run(['nuclei', '-update-templates', '-silent'], 
+                              check=True, 
+                              stdout=subprocess.DEVNULL, 
+                              stderr=subprocess.PIPE,
+                              timeout=300,  # Extended to 5 minutes
+                              env=env)
+        print(f"{Colors.GREEN} Nuclei templates updated successfully{Colors.END}")
+    except subprocess.TimeoutExpired:
+        print(f"{Colors.YELLOW}  Template update timed out (5min) - continuing anyway{Colors.END}")
+        print(f"{Colors.YELLOW}   Templates can be updated later: nuclei -update-templates{Colors.END}")
+    except subprocess.CalledProcessError as e:
+        print(f"{Colors.YELLOW}  Template update failed - continuing anyway{Colors.END}")
+        if e.stderr:
+            error_msg = e.stderr.decode().strip()
+            if error_msg:
+                print(f"{Colors.YELLOW}  Error: {error_msg}{Colors.END}")
+        print(f"{Colors.YELLOW}   Templates can be updated later: nuclei -update-templates{Colors.END}")
+
+_template_update_thread: Optional[threading.Thread] = None
+
+# Go tools built by this run; final verification only executes these
+_installed_this_run = set()
+
+def start_nuclei_template_update() -> None:
+    """Refresh nuclei templates in the background while the remaining phases run."""
+    global _template_update_thread
+    if _template_update_thread is None:
+        _template_update_thread = threading.Thread(target=update_nuclei_templates, daemon=True)
+        _template_update_thread.start()
+
+def wait_for_nuclei_template_update(timeout_seconds: int = 600) -> None:
+    """Block until a background template refresh started by Phase 3 has finished."""
+    if _template_update_thread is not None and _template_update_thread.is_alive():
+        print(f"{Colors.WHITE}Waiting for nuclei template update to finish...{Colors.END}")
+        _template_update_thread.join(timeout=timeout_seconds)
+
 def install_security_tools_complete(distro: str) -> bool:
     """Install all security tools with enhanced dependency checking and error handling."""
     try:
         print(f"\n{Colors.BLUE} Phase 3: Security Tools Installation{Colors.END}")
 
-        # Pre-installation dependency check with recovery
-        if not check_system_dependencies(distro):
-            print(f"{Colors.YELLOW}  Initial dependency check failed, attempting recovery...{Colors.END}")
-            if not attempt_dependency_recovery(distro):
-                print(f"{Colors.RED} System dependencies check failed after recovery attempt{Colors.END}")
-                print(f"{Colors.WHITE}Manual intervention may be required{Colors.END}")
+        # Warm re-runs: skip dependency checks and builds when every tool is already there
+        present = locate_tools(GO_TOOLS).keys()
+        if len(present) == len(GO_TOOLS):
+            print(f"{Colors.GREEN} All security tools already installed ({', '.join(GO_TOOLS)}){Colors.END}")
+            start_nuclei_template_update()
+            return True
+
+        if step_recently_verified('go_prerequisites'):
+            print(f"{Colors.GREEN} System dependencies verified by a recent run - skipping checks{Colors.END}")
+        else:
+            # Pre-installation dependency check with recovery
+            if not check_system_dependencies(distro):
+                print(f"{Colors.YELLOW}  Initial dependency check failed, attempting recovery...{Colors.END}")
+                if not attempt_dependency_recovery(distro):
+                    print(f"{Colors.RED} System dependencies check failed after recovery attempt{Colors.END}")
+                    print(f"{Colors.WHITE}Manual intervention may be required{Colors.END}")
+                    return False
+            
+            # Verify Go tools prerequisites (libpcap-dev now guaranteed from Stage 1)
+            if not verify_go_tools_prerequisites():
+                print(f"{Colors.RED} Go tools prerequisites not met{Colors.END}")
                 return False
-        
-        # Verify Go tools prerequisites (libpcap-dev now guaranteed from Stage 1)
-        if not verify_go_tools_prerequisites():
-            print(f"{Colors.RED} Go tools prerequisites not met{Colors.END}")
-            return False
-        
-        tools = {
-            'naabu': 'github.com/projectdiscovery/naabu/v2/cmd/naabu@v2.1.8',
-            'httpx': 'github.com/projectdiscovery/httpx/cmd/httpx@v1.3.7', 
-            'nuclei': 'github.com/projectdiscovery/nuclei/v3/cmd/nuclei@latest'
-        }
+            mark_step_verified('go_prerequisites')
         
         success_count = 0
-        
-        for tool, repo in tools.items():
-            if tool == 'nuclei':
-                if install_nuclei_with_retries(repo, max_retries=3):
+        installed_via_go = []
+        
+        # The go installs share nothing but the module cache, so build them concurrently,
+        # including nuclei's first attempt
+        parallel_tools = {tool: spec for tool, spec in GO_TOOLS.items() if tool != 'nuclei'}
+        nuclei_future = None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(GO_TOOLS)) as executor:
+            futures = {executor.submit(install_go_tool, tool, spec['repo'], spec['timeout']): tool
+                       for tool, spec in parallel_tools.items()}
+            if 'nuclei' in GO_TOOLS:
+                # Same presence check install_go_tool does, before committing to a 10 minute build
+                if _have('nuclei'):
+                    print(f"{Colors.GREEN}   nuclei already installed{Colors.END}")
                     success_count += 1
                 else:
-                    print(f"{Colors.RED}   nuclei installation failed after multiple attempts{Colors.END}")
-                    continue
+                    nuclei_future = executor.submit(install_nuclei_attempt, GO_TOOLS['nuclei']['repo'], 1)
+            for future in concurrent.futures.as_completed(futures):
+                status = future.result()
+                if status == 'present':
+                    success_count += 1
+                elif status == 'installed':
+                    installed_via_go.append(futures[future])
+        
+        # nuclei retries clean the module cache, so they only run once the other builds are done
+        if nuclei_future is not None:
+            nuclei_installed = nuclei_future.result()
+            if nuclei_installed or install_nuclei_with_retries(GO_TOOLS['nuclei']['repo'], max_retries=3, start_attempt=2):
+                _installed_this_run.add('nuclei')
+                success_count += 1
             else:
-                try:
-                    print(f"{Colors.WHITE}Installing {tool}...{Colors.END}")
-                    if shutil.which(tool):
-                        print(f"{Colors.GREEN}   {tool} already installed{Colors.END}")
-                        success_count += 1
-                        continue
-                    env = os.environ.copy()
-                    env['CGO_ENABLED'] = '1'
-                    env['GO111MODULE'] = 'on'
-                    env['GOPROXY'] = 'https://proxy.golang.org,direct'
-                    env['GOFLAGS'] = '-ldflags="-s -w"'  # Add this line to reduce binary size
-                    timeout_seconds = 600 if tool == 'naabu' else 450
-                    if run_with_timeout(['go', 'install', '-v', '-trimpath', repo], timeout_seconds, f"Installing {tool} (timeout: {timeout_seconds//60}min)", allow_warnings=False):
-                        gopath = subprocess.run(['go', 'env', 'GOPATH'], capture_output=True, text=True, check=True).stdout.strip()
-                        gobin = os.path.join(gopath, 'bin')
-                        tool_path = os.path.join(gobin, tool)
-                        print(f"{Colors.WHITE}  Verifying {tool} installation at {tool_path}...{Colors.END}")
-                        if os.path.exists(tool_path) and os.access(tool_path, os.X_OK):
-                            print(f"{Colors.GREEN}   {tool} installed and verified at {tool_path}{Colors.END}")
-                            success_count += 1
-                        else:
-                            print(f"{Colors.RED}   {tool} installation reported success but binary not found at {tool_path}{Colors.END}")
-                    else:
-                        print(f"{Colors.RED}   {tool} installation failed via go install{Colors.END}")
-                except Exception as e:
-                    print(f"{Colors.RED}   Failed to install {tool}: {e}{Colors.END}")
-          # Update nuclei templates if nuclei was installed (with optimization)
-        if shutil.which('nuclei'):
-            print(f"{Colors.WHITE}Updating nuclei templates (optimized)...{Colors.END}")
+                print(f"{Colors.RED}   nuclei installation failed after multiple attempts{Colors.END}")
+        
+        # Verify all freshly installed binaries with a single GOBIN directory read
+        if installed_via_go:
+            gobin = os.environ.get('GOBIN', '')
             try:
-                # Use non-interactive mode and extended timeout for template updates
-                env = os.environ.copy()
-                env['DEBIAN_FRONTEND'] = 'noninteractive'
-                env['NUCLEI_DISABLE_COLORS'] = 'true'  # Prevent color codes from hanging terminal
-                
-                # Run with extended timeout and silent mode for faster processing
-                result = subprocess.run(['nuclei', '-update-templates', '-silent'], 
-                                      check=True, 
-                                      stdout=subprocess.DEVNULL, 
-                                      stderr=subprocess.PIPE,
-                                      timeout=300,  # Extended to 5 minutes
-                                      env=env)
-                print(f"{Colors.GREEN} Nuclei templates updated successfully{Colors.END}")
-            except subprocess.TimeoutExpired:
-                print(f"{Colors.YELLOW}  Template update timed out (5min) - continuing anyway{Colors.END}")
-                print(f"{Colors.YELLOW}   Templates can be updated later: nuclei -update-templates{Colors.END}")
-            except subprocess.CalledProcessError as e:
-                print(f"{Colors.YELLOW}  Template update failed - continuing anyway{Colors.END}")
-                if e.stderr:
-                    error_msg = e.stderr.decode().strip()
-                    if error_msg:
-                        print(f"{Colors.YELLOW}  Error: {error_msg}{Colors.END}")
-                print(f"{Colors.YELLOW}   Templates can be updated later: nuclei -update-templates{Colors.END}")
+                if not gobin:
+                    gopath = subprocess.run(['go', 'env', 'GOPATH'], capture_output=True, text=True, check=True).stdout.strip()
+                    gobin = os.path.join(gopath, 'bin')
+                gobin_entries = set(os.listdir(gobin))
+            except (OSError, subprocess.CalledProcessError):
+                gobin_entries = set()
+            
+            for tool in installed_via_go:
+                tool_path = os.path.join(gobin, tool)
+                print(f"{Colors.WHITE}  Verifying {tool} installation at {tool_path}...{Colors.END}")
+                if tool in gobin_entries and os.access(tool_path, os.X_OK):
+                    print(f"{Colors.GREEN}   {tool} installed and verified at {tool_path}{Colors.END}")
+                    _installed_this_run.add(tool)
+                    success_count += 1
+                else:
+                    print(f"{Colors.RED}   {tool} installation reported success but binary not found at {tool_path}{Colors.END}")
+        # Update nuclei templates if nuclei was installed (with optimization)
+        if _have('nuclei'):
+            start_nuclei_template_update()
           # Evaluate installation success - nuclei is critical for vulnerability analysis
         if success_count >= 2:  # At least 2 out of 3 tools must be installed
             # Check if nuclei specifically was installed (critical for vulnerability scanning)
-            if shutil.which('nuclei'):
-                print(f"{Colors.GREEN} Security tools installation completed ({success_count}/3 tools) - nuclei available{Colors.END}")
+            if _have('nuclei'):
+                print(f"{Colors.GREEN} Security tools installation completed ({success_count}/{len(GO_TOOLS)} tools) - nuclei available{Colors.END}")
                 return True
             else:
-                print(f"{Colors.YELLOW}  {success_count}/3 tools installed but nuclei is missing{Colors.END}")
+                print(f"{Colors.YELLOW}  {success_count}/{len(GO_TOOLS)} tools installed but nuclei is missing{Colors.END}")
                 print(f"{Colors.RED} Nuclei is critical for vulnerability analysis - installation incomplete{Colors.END}")
                 print(f"{Colors.WHITE}The setup requires nuclei to be installed via 'go install' for proper operation{Colors.END}")
                 return False
         else:
-            print(f"{Colors.RED} Insufficient tools installed ({success_count}/3){Colors.END}")
+            print(f"{Colors.RED} Insufficient tools installed ({success_count}/{len(GO_TOOLS)}){Colors.END}")
             print(f"{Colors.WHITE}Minimum 2 tools required for operation{Colors.END}")
             return False
         
@@ -1132,16 +1656,55 @@ def install_security_tools_complete(distro: str) -> bool:
         print(f"{Colors.RED} Security tools installation failed: {e}{Colors.END}")
         return False
 
+def pip_target_python() -> str:
+    """Interpreter packages are installed for: the virtual environment if one was set up, else this one."""
+    venv_path = os.environ.get('VIRTUAL_ENV')
+    return os.path.join(venv_path, 'bin', 'python') if venv_path else sys.executable
+
+def pip_install_cmd() -> List[str]:
+    """Base argv for installing Python packages; prefers uv's native installer over pip when present."""
+    uv_bin = locate_tool('uv')
+    if uv_bin:
+        return [uv_bin, 'pip', 'install', '--python', pip_target_python(), '-q']
+    # "python -m pip" pins the interpreter, where a bare pip3 could belong to another one
+    return [pip_target_python(), '-m', 'pip', 'install'] + PIP_INSTALL_FLAGS
+
+def pip_nothing_to_install(requirement_args: List[str]) -> bool:
+    """Ask pip for a dry-run report; True only when every requirement is already satisfied."""
+    if _have('uv'):
+        return False  # uv resolves an already-satisfied set about as fast as the check itself
+    try:
+        result = subprocess.run(pip_install_cmd() + ['--dry-run', '--report', '-'] + requirement_args,
+                                capture_output=True, text=True, timeout=120)
+        if result.returncode != 0:
+            return False
+        return not json.loads(result.stdout).get('install')
+    except (OSError, subprocess.TimeoutExpired, ValueError, AttributeError):
+        # pip older than 22.2 has no --report; just run the install
+        return False
+
 def install_python_dependencies() -> bool:
     """Install Python dependencies for enhanced functionality."""
     try:
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        requirements_file = os.path.join(script_dir, 'config', 'requirements.txt')
+        requirements_file = os.path.join(PROJECT_DIR, 'config', 'requirements.txt')
         
         if os.path.exists(requirements_file):
+            # Keyed by the target interpreter (path and link mtime, which changes when a venv is
+            # recreated) and the file's mtime, so editing requirements.txt invalidates it too
+            target_python = pip_target_python()
+            state_key = (f"python_dependencies:{target_python}:{os.lstat(target_python).st_mtime_ns}:"
+                         f"{os.stat(requirements_file).st_mtime_ns}")
+            if step_recently_verified(state_key):
+                print(f"{Colors.GREEN} Python dependencies unchanged since last install - skipping{Colors.END}")
+                return True
+            if pip_nothing_to_install(['-r', requirements_file]):
+                mark_step_verified(state_key)
+                print(f"{Colors.GREEN} Python dependencies already satisfied{Colors.END}")
+                return True
             print(f"{Colors.WHITE}Installing Python dependencies from requirements.txt...{Colors.END}")
-            subprocess.run(['pip3', 'install', '-r', requirements_file], check=True, 
+            subprocess.run(pip_install_cmd() + ['-r', requirements_file], check=True, 
                           stdout=subprocess.DEVNULL)
+            mark_step_verified(state_key)
             print(f"{Colors.GREEN} Python dependencies installed{Colors.END}")
         else:
             # Fallback essential packages
@@ -1154,9 +1717,11 @@ def install_python_dependencies() -> bool:
                 'rich>=13.0.0'
             ]
             
-            for package in essential_packages:
-                subprocess.run(['pip3', 'install', package], check=True, 
+            # One resolver run for the whole set instead of one pip process per package
+            if not pip_nothing_to_install(essential_packages):
+                subprocess.run(pip_install_cmd() + essential_packages, check=True, 
                               stdout=subprocess.DEVNULL)
+            for package in essential_packages:
                 print(f"{Colors.GREEN}   {package}{Colors.END}")
             
         return True
@@ -1171,30 +1736,39 @@ def setup_python_environment() -> bool:
         
         # Check if we're in an externally-managed environment (Kali Linux)
         try:
-            result = subprocess.run(['pip', '--version'], capture_output=True, text=True)
-            if result.returncode != 0 or 'externally-managed' in result.stderr.lower():
+            # PEP 668 marks distro-managed interpreters with a file next to the stdlib
+            externally_managed = os.path.exists(os.path.join(sysconfig.get_path('stdlib'), 'EXTERNALLY-MANAGED'))
+            # pip counts as present when this interpreter can run "python -m pip" (what
+            # pip_install_cmd uses) or a pip/pip3 command is on PATH
+            pip_available = importlib.util.find_spec('pip') is not None or _have('pip') or _have('pip3')
+            if externally_managed or not pip_available:
                 print(f"{Colors.YELLOW} Detected externally-managed Python environment (likely Kali Linux){Colors.END}")
                 
+                # uv builds the venv natively without bootstrapping pip, and needs no python3-venv
+                uv_bin = locate_tool('uv')
+                
                 # Check if python3-venv is available
-                venv_check = subprocess.run(['python3', '-m', 'venv', '--help'], capture_output=True, text=True)
-                if venv_check.returncode != 0:
-                    print(f"{Colors.WHITE}Installing python3-venv...{Colors.END}")
-                    if not run_with_timeout(['env', 'DEBIAN_FRONTEND=noninteractive', 'apt', 'install', 'python3-venv', '-y'], 180, "Installing python3-venv"):
-                        print(f"{Colors.RED} Failed to install python3-venv{Colors.END}")
-                        return False
+                if not uv_bin:
+                    venv_check = subprocess.run(['python3', '-m', 'venv', '--help'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    if venv_check.returncode != 0:
+                        print(f"{Colors.WHITE}Installing python3-venv...{Colors.END}")
+                        if not apt_install(['python3-venv']):
+                            print(f"{Colors.RED} Failed to install python3-venv{Colors.END}")
+                            return False
                 
                 # Create virtual environment in user directory
-                venv_path = os.path.expanduser("~/vulnerability_analysis_venv")
+                venv_path = os.path.join(HOME_DIR, "vulnerability_analysis_venv")
                 if not os.path.exists(venv_path):
                     print(f"{Colors.WHITE}Creating virtual environment at {venv_path}...{Colors.END}")
-                    if not run_with_timeout(['python3', '-m', 'venv', venv_path], 120, "Creating virtual environment"):
+                    venv_cmd = [uv_bin, 'venv', venv_path] if uv_bin else ['python3', '-m', 'venv', venv_path]
+                    if not run_with_timeout(venv_cmd, 120, "Creating virtual environment"):
                         print(f"{Colors.RED} Failed to create virtual environment{Colors.END}")
                         return False
                 
                 # Activate virtual environment by setting environment variables
                 venv_bin = os.path.join(venv_path, 'bin')
                 os.environ['VIRTUAL_ENV'] = venv_path
-                os.environ['PATH'] = f"{venv_bin}:{os.environ.get('PATH', '')}"
+                prepend_to_path(venv_bin)
                 
                 print(f"{Colors.GREEN} Virtual environment created and activated{Colors.END}")
                 print(f"{Colors.WHITE}Virtual environment path: {venv_path}{Colors.END}")
@@ -1203,16 +1777,7 @@ def setup_python_environment() -> bool:
                 activation_cmd = f"source {venv_path}/bin/activate"
                 profile_comment = "# Vulnerability Analysis Virtual Environment"
                 
-                for profile in ['.bashrc', '.zshrc']:
-                    profile_path = os.path.expanduser(f'~/{profile}')
-                    if os.path.exists(profile_path):
-                        with open(profile_path, 'r') as f:
-                            content = f.read()
-                        
-                        if profile_comment not in content:
-                            with open(profile_path, 'a') as f:
-                                f.write(f'\n{profile_comment}\n')
-                                f.write(f'# {activation_cmd}\n')
+                update_shell_profiles(profile_comment, [f'# {activation_cmd}'])
                 
                 return True
             else:
@@ -1227,13 +1792,48 @@ def setup_python_environment() -> bool:
         print(f"{Colors.RED} Python environment setup failed: {e}{Colors.END}")
         return False
 
+def setup_python_phase() -> bool:
+    """Prepare the Python environment, then install the toolkit's Python dependencies into it."""
+    if not setup_python_environment():
+        return False
+    # The scanners run without these; they only enable richer reports, so a failure is not fatal
+    if not install_python_dependencies():
+        print(f"{Colors.YELLOW}  Continuing without some optional Python packages{Colors.END}")
+    return True
+
+def precompile_toolkit_modules(project_dir: str) -> bool:
+    """Byte-compile the toolkit's modules in parallel so MTScan and the workflow start from cached bytecode."""
+    # The installer usually runs as root; a later unprivileged run could not write __pycache__
+    # itself and would recompile every module on each start
+    try:
+        ok = all(compileall.compile_dir(os.path.join(project_dir, package), quiet=1, workers=0)
+                 for package in ('src', 'commands'))
+        ok = compileall.compile_file(os.path.join(project_dir, 'mtscan.py'), quiet=1) and ok
+    except Exception as e:
+        print(f"{Colors.YELLOW}  Could not precompile toolkit modules: {e}{Colors.END}")
+        return False
+    if ok:
+        print(f"{Colors.GREEN} Toolkit modules precompiled{Colors.END}")
+    else:
+        print(f"{Colors.YELLOW}  Some toolkit modules failed to precompile{Colors.END}")
+    return bool(ok)
+
+# Static helper script written by create_configuration_files; built and encoded once at import
+_TOOLKIT_ALIASES_SCRIPT = b'''#!/bin/bash
+# Vulnerability Analysis Toolkit Aliases
+alias vat-scan="python3 $(find . -name 'workflow.py' 2>/dev/null | head -1)"
+alias vat-naabu="naabu"
+alias vat-httpx="httpx"
+alias vat-nuclei="nuclei"
+alias vat-update="nuclei -update-templates"
+'''
+
 def create_configuration_files() -> bool:
     """Create optimized configuration files."""
     try:
         print(f"\n{Colors.BLUE}  Phase 4: Configuration Optimization{Colors.END}")
         
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        config_dir = os.path.join(script_dir, 'config')
+        config_dir = os.path.join(PROJECT_DIR, 'config')
         
         # Create config directory if it doesn't exist
         os.makedirs(config_dir, exist_ok=True)
@@ -1268,37 +1868,23 @@ def create_configuration_files() -> bool:
                 "update_templates": True,
                 "severity": ["critical", "high", "medium"]
             },
-            "tools_paths": {
-                "naabu": shutil.which('naabu') or 'naabu',
-                "httpx": shutil.which('httpx') or 'httpx',
-                "nuclei": shutil.which('nuclei') or 'nuclei'
-            }
+            "tools_paths": {tool: locate_tool(tool) or tool for tool in GO_TOOLS}
         }
         
         config_file = os.path.join(config_dir, 'optimized_config.json')
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        write_file_atomic(config_file, json.dumps(config, indent=2).encode())
         
         print(f"{Colors.GREEN} Configuration file created: {config_file}{Colors.END}")
         
         # Create bash aliases for easy access
-        aliases_content = '''#!/bin/bash
-# Vulnerability Analysis Toolkit Aliases
-alias vat-scan="python3 $(find . -name 'workflow.py' 2>/dev/null | head -1)"
-alias vat-naabu="naabu"
-alias vat-httpx="httpx"
-alias vat-nuclei="nuclei"
-alias vat-update="nuclei -update-templates"
-'''
-        
         aliases_file = os.path.join(config_dir, 'vat_aliases.sh')
-        with open(aliases_file, 'w') as f:
-            f.write(aliases_content)
-        os.chmod(aliases_file, 0o755)
+        write_file_atomic(aliases_file, _TOOLKIT_ALIASES_SCRIPT, 0o755)
         
         print(f"{Colors.GREEN} Aliases created: {aliases_file}{Colors.END}")
         print(f"{Colors.YELLOW} To use aliases: source {aliases_file}{Colors.END}")
         
+        precompile_toolkit_modules(PROJECT_DIR)
+        
         return True
         
     except Exception as e:
@@ -1310,53 +1896,19 @@ def final_verification() -> bool:
     try:
         print(f"\n{Colors.BLUE} Phase 5: Final Verification{Colors.END}")
         
-        tools_to_check = ['naabu', 'httpx', 'nuclei', 'go']
+        tools_to_check = list(GO_TOOLS) + ['go']
         all_good = True
         
-        print(f"{Colors.WHITE}Checking tool availability...{Colors.END}")
-        for tool in tools_to_check:
-            # Enhanced tool detection - check multiple locations
-            tool_found = False
-            tool_path = None
-            
-            # Check standard PATH first
-            tool_path = shutil.which(tool)
-            if tool_path:
-                tool_found = True
-            else:
-                # Check common Go installation locations
-                go_locations = [
-                    os.path.expanduser(f"~/go/bin/{tool}"),
-                    f"/usr/local/go/bin/{tool}",
-                    f"/root/go/bin/{tool}",
-                    f"/home/*/go/bin/{tool}"
-                ]
-                
-                for location in go_locations:
-                    if os.path.exists(location):
-                        tool_path = location
-                        tool_found = True
-                        break
-            
-            if tool_found:
-                print(f"{Colors.GREEN}   {tool}: Available at {tool_path}{Colors.END}")
-            else:
-                print(f"{Colors.RED}   {tool}: Not found{Colors.END}")
-                all_good = False
-          
-        # Test basic functionality with enhanced path detection
-        print(f"{Colors.WHITE}Testing tool functionality...{Colors.END}")
-        
         # Function to find tool path
         def find_tool_path(tool_name):
-            # Check standard PATH first
-            path = shutil.which(tool_name)
+            # PATH and GOBIN first, reusing what earlier phases already located
+            path = locate_tool(tool_name)
             if path:
                 return path
             
             # Check common Go installation locations
             go_locations = [
-                os.path.expanduser(f"~/go/bin/{tool_name}"),
+                os.path.join(HOME_DIR, "go", "bin", tool_name),
                 f"/usr/local/go/bin/{tool_name}",
                 f"/root/go/bin/{tool_name}"
             ]
@@ -1366,58 +1918,50 @@ def final_verification() -> bool:
                     return location
             return None
         
-        # Test nuclei
-        nuclei_path = find_tool_path('nuclei')
-        if nuclei_path:
-            try:
-                result = subprocess.run([nuclei_path, '-version'], 
-                                      capture_output=True, text=True, 
-                                      timeout=10, check=True)
-                print(f"{Colors.GREEN}   nuclei: {result.stdout.strip()}{Colors.END}")
-            except:
-                print(f"{Colors.YELLOW}    nuclei: Version check failed{Colors.END}")
-        else:
-            print(f"{Colors.YELLOW}    nuclei: Not found for testing{Colors.END}")
+        # Resolve every tool once; the availability and functionality checks share the result
+        tool_paths = {tool: find_tool_path(tool) for tool in tools_to_check}
         
-        # Test naabu
-        naabu_path = find_tool_path('naabu')
-        if naabu_path:
-            try:
-                result = subprocess.run([naabu_path, '-version'], 
-                                      capture_output=True, text=True, 
-                                      timeout=10, check=True)
-                print(f"{Colors.GREEN}   naabu: Working{Colors.END}")
-            except:
-                print(f"{Colors.YELLOW}    naabu: Version check failed{Colors.END}")
-        else:
-            print(f"{Colors.YELLOW}    naabu: Not found for testing{Colors.END}")
+        print(f"{Colors.WHITE}Checking tool availability...{Colors.END}")
+        for tool in tools_to_check:
+            tool_path = tool_paths[tool]
+            if tool_path:
+                print(f"{Colors.GREEN}   {tool}: Available at {tool_path}{Colors.END}")
+            else:
+                print(f"{Colors.RED}   {tool}: Not found{Colors.END}")
+                all_good = False
+          
+        # Test basic functionality with enhanced path detection. Binaries that were
+        # already present before this run were not touched, so only new builds are executed
+        print(f"{Colors.WHITE}Testing tool functionality...{Colors.END}")
         
-        # Test httpx
-        httpx_path = find_tool_path('httpx')
-        if httpx_path:
+        # Test each tool and count the ones found, even if they are not in PATH
+        tools_found = 0
+        for tool in GO_TOOLS:
+            tool_path = tool_paths[tool]
+            if not tool_path:
+                print(f"{Colors.YELLOW}    {tool}: Not found for testing{Colors.END}")
+                continue
+            
+            tools_found += 1
+            if tool not in _installed_this_run:
+                print(f"{Colors.GREEN}   {tool}: Already installed{Colors.END}")
+                continue
             try:
-                result = subprocess.run([httpx_path, '-version'], 
+                result = subprocess.run([tool_path, '-version'], 
                                       capture_output=True, text=True, 
                                       timeout=10, check=True)
-                print(f"{Colors.GREEN}   httpx: Working{Colors.END}")
+                status = result.stdout.strip() if tool == 'nuclei' else 'Working'
+                print(f"{Colors.GREEN}   {tool}: {status}{Colors.END}")
             except:
-                print(f"{Colors.YELLOW}    httpx: Version check failed{Colors.END}")
-        else:
-            print(f"{Colors.YELLOW}    httpx: Not found for testing{Colors.END}")
-        
-        # Enhanced success criteria - if tools are found even if not in PATH, consider it success
-        tools_found = 0
-        for tool in ['naabu', 'httpx', 'nuclei']:
-            if find_tool_path(tool):
-                tools_found += 1
+                print(f"{Colors.YELLOW}    {tool}: Version check failed{Colors.END}")
         
         if tools_found >= 2:  # At least 2 out of 3 tools found
-            print(f"{Colors.GREEN} Verification passed: {tools_found}/3 tools found{Colors.END}")
-            if tools_found < 3:
+            print(f"{Colors.GREEN} Verification passed: {tools_found}/{len(GO_TOOLS)} tools found{Colors.END}")
+            if tools_found < len(GO_TOOLS):
                 print(f"{Colors.YELLOW} Add Go tools to PATH: export PATH=$PATH:~/go/bin{Colors.END}")
             return True
         else:
-            print(f"{Colors.RED} Insufficient tools found: {tools_found}/3{Colors.END}")
+            print(f"{Colors.RED} Insufficient tools found: {tools_found}/{len(GO_TOOLS)}{Colors.END}")
             return False
         
     except Exception as e:
@@ -1446,6 +1990,56 @@ def print_success_message():
     print(f"{Colors.WHITE}  python src/workflow.py 192.168.1.0/24{Colors.END}")
     print(f"\n{Colors.GREEN}{'='*80}{Colors.END}")
 
+_install_state: Dict[str, float] = {}
+
+def load_install_state(force: bool = False) -> None:
+    """Load the steps verified within INSTALL_STATE_TTL on this environment; --force starts from an empty state."""
+    global _install_state
+    _install_state = {}
+    if force:
+        return
+    try:
+        with open(INSTALL_STATE_FILE, 'r') as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return
+    if not isinstance(saved, dict) or saved.get('environment') != INSTALL_STATE_ENVIRONMENT:
+        return
+    now = time.time()
+    steps = saved.get('steps')
+    if isinstance(steps, dict):
+        _install_state = {step: stamp for step, stamp in steps.items()
+                          if isinstance(stamp, (int, float)) and 0 <= now - stamp < INSTALL_STATE_TTL}
+
+def step_recently_verified(step: str) -> bool:
+    """Check whether a step succeeded in a run within the last INSTALL_STATE_TTL seconds."""
+    return step in _install_state
+
+def mark_step_verified(step: str) -> None:
+    """Record a successful step; written atomically so an interrupted run cannot corrupt the cache."""
+    _install_state[step] = time.time()
+    try:
+        os.makedirs(os.path.dirname(INSTALL_STATE_FILE), exist_ok=True)
+        write_file_atomic(INSTALL_STATE_FILE, json.dumps({'environment': INSTALL_STATE_ENVIRONMENT, 'steps': _install_state}).encode())
+    except OSError:
+        pass  # The cache is only an optimization
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse installer command line options."""
+    parser = argparse.ArgumentParser(description="Linux Vulnerability Analysis Toolkit installer")
+    parser.add_argument('--force', action='store_true',
+                        help='Re-run every step even if a recent run already verified it')
+    parser.add_argument('-y', '--assume-yes', action='store_true',
+                        default=os.environ.get('PROJETO_ASSUME_YES') == '1',
+                        help='Answer yes to every prompt (also enabled by PROJETO_ASSUME_YES=1)')
+    return parser.parse_args(argv)
+
+def confirm(prompt: str, assume_yes: bool = False) -> bool:
+    """Ask a yes/no question, answering yes without blocking under --assume-yes or without a terminal."""
+    if assume_yes or not sys.stdin.isatty():
+        return True
+    return input(prompt).strip().lower() in ('y', 'yes')
+
 def check_disk_space(min_gb: float = 2.0) -> bool:
     """Check available disk space and warn if insufficient."""
     try:
@@ -1485,6 +2079,8 @@ def check_disk_space(min_gb: float = 2.0) -> bool:
 
 def main():
     """Main installation orchestrator with complete multi-phase setup."""
+    args = parse_arguments()
+    load_install_state(force=args.force)
     try:
         # Print header
         print_header()
@@ -1497,8 +2093,7 @@ def main():
         
         # Check disk space before starting installation
         if not check_disk_space(min_gb=2.0):
-            response = input(f"{Colors.YELLOW}Continue anyway? (y/N): {Colors.END}")
-            if response.lower() != 'y':
+            if not confirm(f"{Colors.YELLOW}Continue anyway? (y/N): {Colors.END}", args.assume_yes):
                 print(f"{Colors.RED} Installation cancelled due to insufficient disk space{Colors.END}")
                 return False
         
@@ -1510,37 +2105,52 @@ def main():
         distro_config = SUPPORTED_DISTROS[distro]
         print(f"{Colors.GREEN} System validation passed{Colors.END}")
         
-        # Installation phases with optimized order
+        # Installation phases with optimized order. Phases with a state key only touch
+        # system state, so a recent successful run lets them be skipped; the others also
+        # prepare this process's environment (PATH, GOPATH, venv) and always run
         phases = [
-            ("Python Environment Setup", setup_python_environment),
-            ("Minimal System Packages", lambda: install_system_packages(distro_config)),
-            ("Go Environment", setup_go_environment_complete),
-            ("Security Tools", lambda: install_security_tools_complete(distro)),
-            ("Configuration", create_configuration_files),
-            ("Final Verification", final_verification)
+            ("Minimal System Packages", lambda: install_system_packages(distro_config), 'system_packages'),
+            ("Python Environment Setup", setup_python_phase, None),
+            ("Go Environment", setup_go_environment_complete, None),
+            ("Security Tools", lambda: install_security_tools_complete(distro), None),
+            ("Configuration", create_configuration_files, None),
+            ("Final Verification", final_verification, None)
         ]
         
-        for phase_name, phase_func in phases:
+        for phase_name, phase_func, state_key in phases:
+            if state_key and step_recently_verified(state_key):
+                print(f"\n{Colors.GREEN} {phase_name}: verified by a recent run - skipping (use --force to re-run){Colors.END}")
+                continue
             if not phase_func():
                 print(f"\n{Colors.RED} Installation failed at: {phase_name}{Colors.END}")
                 print(f"{Colors.WHITE}Please check the error messages above and try again{Colors.END}")
                 return False
+            if state_key:
+                mark_step_verified(state_key)
+        
+        # Templates must be in place before MTScan can be launched below
+        wait_for_nuclei_template_update()
         
         # Success!
         print_success_message()
         
         # Auto-launch MTScan menu
         try:
-            response = input(" Launch MTScan interactive menu now? [Y/n]: ").strip().lower()
-            if response in ['', 'y', 'yes']:
+            # The menu itself is interactive, so only offer it when there is a terminal to drive it
+            if sys.stdin.isatty() and (args.assume_yes or
+                                       input(" Launch MTScan interactive menu now? [Y/n]: ").strip().lower() in ['', 'y', 'yes']):
                 print("\n Launching MTScan...")
                 print("=" * 40)
                 print(f"{Colors.YELLOW}Note: If tools show as 'Not installed', run: export PATH=$PATH:~/go/bin{Colors.END}")
                 # Change to the parent directory and launch mtscan from root
-                parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                mtscan_path = os.path.join(parent_dir, "mtscan.py")
+                mtscan_path = os.path.join(PROJECT_DIR, "mtscan.py")
                 if os.path.exists(mtscan_path):
-                    subprocess.run(["python", mtscan_path], cwd=parent_dir)
+                    # Run the menu in this interpreter rather than starting a second one
+                    os.chdir(PROJECT_DIR)
+                    try:
+                        runpy.run_path(mtscan_path, run_name="__main__")
+                    except SystemExit:
+                        pass  # mtscan leaves through sys.exit when its menu is closed
                 else:
                     print(" Could not find mtscan.py. Please run it manually.")
             else:
@@ -6,18 +6,21 @@ Main interface for the Linux Vulnerability Analysis Toolkit
 
 import os
 import sys
-import platform
 import subprocess
 import datetime
 import shutil
-import socket
 import re
-import ipaddress
-import urllib.parse
-import threading
 import time
+import functools
+import concurrent.futures
 from pathlib import Path
 
+# Resolved once; the tool search below builds several paths under it
+HOME_DIR = os.path.expanduser('~')
+
+# Tools the menu reports on, in display order
+SECURITY_TOOLS = ('naabu', 'httpx', 'nuclei')
+
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -29,16 +32,10 @@ except ImportError:
     UTILS_AVAILABLE = False
     def get_executable_path(cmd):
         """Fallback function if utils not available."""
-        try:
-            result = subprocess.run(['which', cmd], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
-        except:
-            pass
-        return None
+        return shutil.which(cmd)
 
 # Ensure we're running on Linux
-if platform.system().lower() != "linux":
+if not sys.platform.startswith("linux"):
     print("┌─────────────────────────────────────────────────────────────────┐")
     print("│                             ERROR                               │")
     print("│                                                                 │")
@@ -73,16 +70,21 @@ def print_banner():
     print("╚══════════════════════════════════════════════════════════════════════════╝")
     print()
 
+@functools.lru_cache(maxsize=None)
 def find_tool_path(tool_name):
-    """Find tool path using multiple methods to handle different installations."""
+    """Find tool path using multiple methods to handle different installations.
+
+    Results are cached for the session since the menu redraws the tool status
+    on every iteration; call find_tool_path.cache_clear() after installing tools.
+    """
     # Common installation paths (order matters - prefer system packages first)
     search_paths = [
         f"/usr/bin/{tool_name}",           # System package (apt, yum, etc.)
         f"/usr/local/bin/{tool_name}",     # Manual system-wide installation
         f"/snap/bin/{tool_name}",          # Snap package
-        f"{os.path.expanduser('~')}/go/bin/{tool_name}",  # User Go installation
+        f"{HOME_DIR}/go/bin/{tool_name}",  # User Go installation
         f"/root/go/bin/{tool_name}",       # Root Go installation
-        f"{os.path.expanduser('~')}/.local/bin/{tool_name}",  # Local user installation
+        f"{HOME_DIR}/.local/bin/{tool_name}",  # Local user installation
         f"/opt/{tool_name}/{tool_name}",   # Custom installation directory
     ]
     
@@ -97,21 +99,15 @@ def find_tool_path(tool_name):
             return path_result
     
     # Fallback: try to find in PATH
-    try:
-        result = subprocess.run(['which', tool_name], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0 and result.stdout.strip():
-            tool_path = result.stdout.strip()
-            if verify_tool_works(tool_path):
-                return tool_path
-    except:
-        pass
+    tool_path = shutil.which(tool_name)
+    if tool_path and verify_tool_works(tool_path):
+        return tool_path
     
     # Then check common paths
     for path in search_paths:
-        expanded_path = os.path.expanduser(path)
-        if os.path.isfile(expanded_path) and os.access(expanded_path, os.X_OK):
-            if verify_tool_works(expanded_path):
-                return expanded_path
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            if verify_tool_works(path):
+                return path
     
     # Additional check for Go tools in current user's GOPATH
     try:
@@ -132,7 +128,8 @@ def verify_tool_works(tool_path):
         # Try common version/help flags
         for flag in ["--version", "-version", "-v", "--help", "-h"]:
             try:
-                result = subprocess.run([tool_path, flag], capture_output=True, text=True, timeout=5)
+                result = subprocess.run([tool_path, flag], stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL, timeout=5)
                 if result.returncode == 0:
                     return True
             except:
@@ -143,11 +140,13 @@ def verify_tool_works(tool_path):
 
 def check_tools_status():
     """Check the status of required tools with flexible path detection."""
-    tools = ['naabu', 'httpx', 'nuclei']
     status = {}
     
-    for tool in tools:
-        tool_path = find_tool_path(tool)
+    # Each cold lookup forks the tool to verify it; probe them side by side
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(SECURITY_TOOLS)) as executor:
+        tool_paths = executor.map(find_tool_path, SECURITY_TOOLS)
+    
+    for tool, tool_path in zip(SECURITY_TOOLS, tool_paths):
         status[tool] = {
             'installed': tool_path is not None,
             'path': tool_path
@@ -651,9 +650,9 @@ def run_scan(scan_type, target, **kwargs):
             
             # Find and display the latest results directory
             try:
-                result_dirs = [item for item in os.listdir('.') if os.path.isdir(item) and item.startswith('results_')]
+                result_dirs = list_result_dirs()
                 if result_dirs:
-                    latest_dir = max(result_dirs, key=lambda x: os.path.getmtime(x))
+                    latest_dir = result_dirs[0]
                     print(f"[DIRECTORY] {latest_dir}")
                     
                     # List key files
@@ -714,6 +713,15 @@ def run_scan(scan_type, target, **kwargs):
         return False
 
 
+def list_result_dirs():
+    """Return results_* directories in the current directory, newest first."""
+    # scandir yields the type and mtime with each entry instead of extra stat calls per name
+    with os.scandir('.') as entries:
+        dirs = [(entry.stat().st_mtime, entry.name) for entry in entries
+                if entry.name.startswith('results_') and entry.is_dir()]
+    dirs.sort(reverse=True)
+    return [name for _, name in dirs]
+
 def view_results():
     """View previous scan results."""
     clear_screen()
@@ -721,20 +729,14 @@ def view_results():
     print("PREVIOUS SCAN RESULTS:")
     print("=" * 50)
     
-    # Find all result directories
-    result_dirs = []
-    for item in os.listdir('.'):
-        if os.path.isdir(item) and item.startswith('results_'):
-            result_dirs.append(item)
+    # Find all result directories (newest first)
+    result_dirs = list_result_dirs()
     
     if not result_dirs:
         print("No previous scan results found.")
         input("\nPress Enter to continue...")
         return
     
-    # Sort by modification time (newest first)
-    result_dirs.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-    
     # Display results
     for i, result_dir in enumerate(result_dirs[:10], 1):  # Show last 10
         stat = os.stat(result_dir)
@@ -779,14 +781,12 @@ def view_result_details(result_dir):
         else:
             # Fallback: show directory contents if comprehensive report not found
             print("Directory contents:")
-            files = os.listdir(result_dir)
-            for file in sorted(files):
-                file_path = os.path.join(result_dir, file)
-                if os.path.isfile(file_path):
-                    size = os.path.getsize(file_path)
-                    print(f"    {file} ({size} bytes)")
-                elif os.path.isdir(file_path):
-                    print(f"    {file}/")
+            with os.scandir(result_dir) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.is_file():
+                        print(f"    {entry.name} ({entry.stat().st_size} bytes)")
+                    elif entry.is_dir():
+                        print(f"    {entry.name}/")
             
             print("\nNote: No comprehensive_scan_report.txt found.")
             print("This might be an older scan result or incomplete scan.")
@@ -905,6 +905,9 @@ def install_tools():
     except Exception as e:
         print(f"Installation failed: {e}")
     
+    # Tool locations may have changed, so re-detect them on the next status check
+    find_tool_path.cache_clear()
+    
     input("\nPress Enter to continue...")
 
 def get_naabu_flags():
@@ -1574,6 +1577,10 @@ def validate_target_input(target):
     if not target or target.isspace():
         return False, "Target cannot be empty or whitespace only"
     
+    # Only needed once a target is entered, so kept off the menu's startup path
+    import ipaddress
+    import urllib.parse
+    
     target = target.strip()
     
     # Handle URLs by extracting the domain/IP
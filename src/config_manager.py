@@ -6,13 +6,12 @@ Handles automatic configuration, settings persistence, and validation
 
 import os
 import json
-import platform
 import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 
 # Import utilities
-from utils import get_system_memory_gb  # Import centralized function
+from utils import get_system_memory_gb, SYSTEM_NAME  # Import centralized function and platform name
 
 # Default configuration settings
 DEFAULT_CONFIG = {
@@ -155,7 +154,7 @@ def auto_configure() -> Dict[str, Any]:
     
     # Check for root/admin access in a platform-independent way
     is_root = False
-    if platform.system() != "Windows":
+    if SYSTEM_NAME != "windows":
         try:
             # os.geteuid() is only available on Unix-like systems
             if hasattr(os, 'geteuid'):
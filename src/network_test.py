@@ -10,6 +10,9 @@ import subprocess
 import urllib.request
 import time
 
+# Flag file that makes workflow.py skip its connectivity check; lives next to this module
+OVERRIDE_FLAG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'network_override')
+
 def test_dns():
     """Test DNS resolution."""
     print("Testing DNS resolution...")
@@ -92,7 +95,7 @@ def test_local_network(network_prefix="192.168."):
 
 def get_override_flag():
     """Check if override flag file exists."""
-    override_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'network_override')
+    override_path = OVERRIDE_FLAG_PATH
     if os.path.exists(override_path):
         print("Network override flag found - will bypass connectivity checks")
         return True
@@ -100,7 +103,7 @@ def get_override_flag():
 
 def create_override_flag():
     """Create network override flag file."""
-    override_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'network_override')
+    override_path = OVERRIDE_FLAG_PATH
     try:
         with open(override_path, 'w') as f:
             f.write(f"# Network check override created on {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
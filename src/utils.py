@@ -1,44 +1,92 @@
 import os
 import sys
 import socket
+import select
 import platform
 import subprocess
 import shutil
+import shlex
 import time
+import random
 import json
+import struct
 from pathlib import Path
 from typing import List, Dict, Any, Union, Optional, Tuple
 
 # Constants for reuse across modules
 DEFAULT_TIMEOUT = 300
 DEFAULT_RETRY = 1
+DEFAULT_BACKOFF_BASE = 1.0
+DEFAULT_MAX_WAIT = 30.0
+# Exit codes run_cmd treats specially when deciding whether to retry
+EXIT_COMMAND_NOT_FOUND = 127  # Shell could not find the command - retrying cannot help
 SECURITY_TOOLS = ["naabu", "httpx", "nuclei"]
 
-def run_cmd(cmd: Union[str, List[str]], shell: bool = False, check: bool = False, use_sudo: bool = False, timeout: int = DEFAULT_TIMEOUT, retry: int = DEFAULT_RETRY, silent: bool = False) -> bool:
+# Minimal DNS query (NS record of the root zone, recursion desired) used by check_network;
+# any reply at all proves the server is reachable over UDP
+_DNS_PROBE_QUERY = struct.pack('>HHHHHH', 0x5654, 0x0100, 1, 0, 0, 0) + b'\x00' + struct.pack('>HH', 2, 1)
+
+# Process-wide facts that cannot change during a run; resolved once at import
+SYSTEM_NAME = platform.system().lower()
+# os.geteuid() is only available on Unix-like systems
+IS_ROOT = hasattr(os, 'geteuid') and os.geteuid() == 0
+# What run_cmd(use_sudo=True) has to put in front of a command
+_NEEDS_SUDO = SYSTEM_NAME != "windows" and not IS_ROOT
+_SUDO_PREFIX = ["sudo"] if _NEEDS_SUDO else []
+HOME_DIR = os.path.expanduser('~')
+GO_BIN_DIR = os.path.join(HOME_DIR, 'go', 'bin')
+
+def _retry_delay(attempt: int, backoff_base: float, max_wait: float) -> float:
+    """Exponential backoff with jitter so retries do not hammer apt/go mirrors in lockstep."""
+    delay = backoff_base * (2 ** attempt)
+    return min(max_wait, delay + random.uniform(0, 0.5 * delay))
+
+def _deadline_passed(deadline: Optional[float]) -> bool:
+    """True once a time.monotonic() deadline has been reached; None never expires."""
+    return deadline is not None and time.monotonic() >= deadline
+
+def _sleep_before_retry(attempt: int, backoff_base: float, max_wait: float, deadline: Optional[float]) -> None:
+    """Back off before the next attempt, never sleeping past the overall deadline."""
+    delay = _retry_delay(attempt, backoff_base, max_wait)
+    if deadline is not None:
+        delay = min(delay, max(0.0, deadline - time.monotonic()))
+    time.sleep(delay)
+
+def run_cmd(cmd: Union[str, List[str]], shell: bool = False, check: bool = False, use_sudo: bool = False, timeout: int = DEFAULT_TIMEOUT, retry: int = DEFAULT_RETRY, silent: bool = False, backoff_base: float = DEFAULT_BACKOFF_BASE, max_wait: float = DEFAULT_MAX_WAIT, max_total_seconds: Optional[float] = None) -> bool:
     """Enhanced command runner with real-time output for security tools."""
     if isinstance(cmd, list):
         cmd_str = ' '.join(cmd)
     else:
         cmd_str = cmd
+        # Without a shell a string would be taken as one program name; split it into argv
+        # so it gets the same direct, shell-free launch as a list
+        if not shell:
+            cmd = shlex.split(cmd)
+    
+    # Handle sudo and Windows special case in a platform-independent way.
+    # Done once, so a retry does not stack another "sudo" in front of the command
+    if use_sudo and _NEEDS_SUDO:
+        if isinstance(cmd, list):
+            cmd = _SUDO_PREFIX + cmd
+        else:
+            cmd = f"sudo {cmd}"
+    
+    # An absolute executable plus close_fds=False lets CPython start the child with
+    # posix_spawn (vfork+exec) instead of fork+exec. Python's own descriptors are
+    # non-inheritable by default (PEP 446), so nothing leaks into the child
+    if isinstance(cmd, list) and not shell and cmd and not os.path.dirname(cmd[0]):
+        resolved = shutil.which(cmd[0])
+        if resolved:
+            cmd = [resolved] + cmd[1:]
+    
+    # Overall budget across every attempt and backoff sleep
+    deadline = time.monotonic() + max_total_seconds if max_total_seconds else None
         
     for attempt in range(retry + 1):
         try:
             if not silent:
                 print(f"Running: {cmd_str}")
             
-            # Handle sudo and Windows special case in a platform-independent way
-            if use_sudo and platform.system().lower() != "windows":
-                try:
-                    # os.geteuid() is only available on Unix-like systems
-                    if hasattr(os, 'geteuid') and os.geteuid() != 0: # type: ignore
-                        if isinstance(cmd, list):
-                            cmd = ["sudo"] + cmd
-                        else:
-                            cmd = f"sudo {cmd}"
-                except AttributeError:
-                    # We're not on a Unix system, so we can't use sudo
-                    pass
-            
             # For security tools, we want real-time output, so don't capture stdout/stderr
             # unless explicitly silenced
             if silent:
@@ -47,15 +95,15 @@ def run_cmd(cmd: Union[str, List[str]], shell: bool = False, check: bool = False
                     cmd, 
                     shell=shell, 
                     stdout=subprocess.DEVNULL, 
-                    stderr=subprocess.DEVNULL, 
-                    text=True
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False
                 )
             else:
                 # Real-time mode - let output pass through to terminal
                 process = subprocess.Popen(
                     cmd, 
-                    shell=shell, 
-                    text=True
+                    shell=shell,
+                    close_fds=False
                 )
             
             # Wait with timeout
@@ -64,11 +112,11 @@ def run_cmd(cmd: Union[str, List[str]], shell: bool = False, check: bool = False
                 
                 # Check return code
                 if process.returncode != 0:
-                    # Retry logic
-                    if attempt < retry:
+                    # Retry logic - a missing command fails the same way every time
+                    if process.returncode != EXIT_COMMAND_NOT_FOUND and attempt < retry and not _deadline_passed(deadline):
                         if not silent:
                             print(f"Command failed. Retrying ({attempt+1}/{retry})...")
-                        time.sleep(2 * (attempt + 1))  # Exponential backoff
+                        _sleep_before_retry(attempt, backoff_base, max_wait, deadline)
                         continue
                     
                     if check:
@@ -82,41 +130,47 @@ def run_cmd(cmd: Union[str, List[str]], shell: bool = False, check: bool = False
                 process.wait()
                 if not silent:
                     print(f"Command timed out after {timeout} seconds: {cmd_str}")
-                if attempt < retry:
+                if attempt < retry and not _deadline_passed(deadline):
                     if not silent:
                         print(f"Retrying ({attempt+1}/{retry})...")
-                    time.sleep(2 * (attempt + 1))
+                    _sleep_before_retry(attempt, backoff_base, max_wait, deadline)
                     continue
                 return False
                 
         except subprocess.CalledProcessError as e:
+            # Only raised above for check=True, after the retry decision was already made
+            # (exit 127, exhausted attempts or an expired deadline); let it reach the caller
             if not silent:
                 print(f"Command failed: {e}")
-            if attempt < retry:
-                if not silent:
-                    print(f"Retrying ({attempt+1}/{retry})...")
-                time.sleep(2 * (attempt + 1))
-                continue
+            raise
+        except FileNotFoundError as e:
+            # The executable does not exist - no retry can fix that
+            if not silent:
+                print(f"Error running command {cmd_str}: {str(e)}")
             return False
         except Exception as e:
             if not silent:
                 print(f"Error running command {cmd_str}: {str(e)}")
-            if attempt < retry:
+            if attempt < retry and not _deadline_passed(deadline):
                 if not silent:
                     print(f"Retrying ({attempt+1}/{retry})...")
-                time.sleep(2 * (attempt + 1))
+                _sleep_before_retry(attempt, backoff_base, max_wait, deadline)
                 continue
             return False
     
     return False
 
+def _go_bin_entries() -> set:
+    """Names in ~/go/bin from a single directory read, for membership tests instead of per-tool stats."""
+    try:
+        return set(os.listdir(GO_BIN_DIR))
+    except OSError:
+        return set()
+
 def check_required_commands(commands: List[str]) -> List[str]:
     """Check if required commands are available and return missing ones."""
-    missing = []
-    for cmd in commands:
-        if not shutil.which(cmd) and not os.path.exists(os.path.expanduser(f"~/go/bin/{cmd}")):
-            missing.append(cmd)
-    return missing
+    go_bin_entries = _go_bin_entries()
+    return [cmd for cmd in commands if cmd not in go_bin_entries and not shutil.which(cmd)]
 
 def safe_read_json(json_file: str, default: Any = None) -> Any:
     """Safely read a JSON file with error handling."""
@@ -166,11 +220,12 @@ def check_tools_installation() -> Dict[str, Dict[str, Any]]:
         "nuclei": {"installed": False, "version": None, "command": "nuclei -version"}
     }
     
+    go_bin_entries = _go_bin_entries()
     for tool, data in tools.items():
         # Check if tool exists in PATH or ~/go/bin
         tool_path = shutil.which(tool)
-        if not tool_path and os.path.exists(os.path.expanduser(f"~/go/bin/{tool}")):
-            tool_path = os.path.expanduser(f"~/go/bin/{tool}")
+        if not tool_path and tool in go_bin_entries:
+            tool_path = os.path.join(GO_BIN_DIR, tool)
         
         if tool_path:
             try:
@@ -190,14 +245,41 @@ def check_tools_installation() -> Dict[str, Dict[str, Any]]:
 def check_network() -> bool:
     """Check for network connectivity."""
     dns_servers = ["8.8.8.8", "1.1.1.1", "9.9.9.9"]
-    
-    for dns in dns_servers:
-        try:
-            # Try connecting to DNS server with timeout
-            socket.create_connection((dns, 53), 3)
-            return True
-        except (socket.timeout, socket.error, OSError):
-            continue
+
+    # Query every server at once and take the first reply: one shared 1.5s deadline
+    # instead of 1.5s per unreachable server. UDP means no TCP handshake, and unlike
+    # a bare connect() a reply proves packets actually reach the server and come back
+    sockets = []
+    pending = []
+    try:
+        for dns in dns_servers:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sockets.append(sock)
+            sock.setblocking(False)
+            try:
+                sock.sendto(_DNS_PROBE_QUERY, (dns, 53))
+                pending.append(sock)
+            except OSError:
+                continue
+
+        deadline = time.monotonic() + 1.5
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select(pending, [], [], remaining)
+            for sock in readable:
+                try:
+                    sock.recvfrom(512)
+                    return True
+                except OSError:
+                    # e.g. ICMP port unreachable surfaced as ECONNREFUSED
+                    pending.remove(sock)
+    except OSError:
+        pass
+    finally:
+        for sock in sockets:
+            sock.close()
     
     print("No network connection detected. Please check your internet connection.")
     return False
@@ -220,13 +302,13 @@ def get_executable_path(cmd: str) -> Optional[str]:
     
     # Common Go tool installation locations
     possible_locations = [
-        os.path.expanduser(f"~/go/bin/{cmd}"),           # User's go/bin
+        os.path.join(GO_BIN_DIR, cmd),                   # User's go/bin
         f"/root/go/bin/{cmd}",                           # Root's go/bin (common in Kali)
         f"/usr/local/go/bin/{cmd}",                      # System Go installation
         f"/usr/bin/{cmd}",                               # System package manager
         f"/usr/local/bin/{cmd}",                         # Local installation
         f"/opt/go/bin/{cmd}",                            # Alternative Go location
-        os.path.expanduser(f"~/.local/bin/{cmd}"),       # User's local bin
+        os.path.join(HOME_DIR, '.local', 'bin', cmd),    # User's local bin
         f"/snap/bin/{cmd}",                              # Snap packages
     ]
     
@@ -268,8 +350,7 @@ def ensure_executable(file_path: str) -> bool:
 
 def verify_linux_platform() -> bool:
     """Verify that the script is running on a Linux platform."""
-    import platform
-    if platform.system().lower() != "linux":
+    if SYSTEM_NAME != "linux":
         print("This toolkit is designed EXCLUSIVELY for Linux systems.")
         print("Supported: Debian, Kali Linux, Ubuntu, Arch Linux")
         print("NOT Supported: Windows, macOS, WSL")
@@ -11,14 +11,19 @@ import datetime
 import json
 import time
 import signal
+import threading
 import platform
 import subprocess
 import shutil
 import socket
 import urllib.request
+import concurrent.futures
 from pathlib import Path
 from typing import Optional, Dict, List, Any, Union, Tuple
 
+# Resolved once at import instead of on every platform check
+SYSTEM_NAME = platform.system().lower()
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -61,7 +66,7 @@ except ImportError as e:
         return shutil.which(cmd)
     
     def verify_linux_platform():
-        return platform.system().lower() == "linux"
+        return SYSTEM_NAME == "linux"
 
 # Try to import config_manager if available
 try:
@@ -156,16 +161,24 @@ def run_with_clean_output_only(cmd: List[str], output_file: Optional[str] = None
             cwd=os.getcwd()
         )
         
-        # Capture all output without displaying
-        stdout, stderr = process.communicate()
-        return_code = process.returncode
-          # Process stdout lines and filter for clean results
-        if stdout:
-            lines = stdout.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line and not is_noise_line(line):
-                    captured_output.append(line)
+        # Drain stderr on a side thread, keeping only the few relevant error lines we report;
+        # reading both pipes in one thread could deadlock once stderr fills its pipe buffer
+        relevant_errors = []
+        def drain_stderr():
+            for err_line in process.stderr:
+                err_line = err_line.strip()
+                if err_line and len(relevant_errors) < 3 and is_relevant_error(err_line):
+                    relevant_errors.append(err_line)
+        stderr_reader = threading.Thread(target=drain_stderr, daemon=True)
+        stderr_reader.start()
+        
+        # Filter stdout as it arrives instead of buffering the whole run in memory
+        for line in process.stdout:
+            line = line.strip()
+            if line and not is_noise_line(line):
+                captured_output.append(line)
+        return_code = process.wait()
+        stderr_reader.join()
         
         # Determine if scan was successful
         # For HTTPx, no results can be expected if no web services are running
@@ -183,11 +196,8 @@ def run_with_clean_output_only(cmd: List[str], output_file: Optional[str] = None
         else:
             print(f"[{tool_name}] Scan completed with errors - {len(captured_output)} results")
             # Add any relevant error info
-            if stderr and stderr.strip():
-                error_lines = [line.strip() for line in stderr.strip().split('\n') if line.strip()]
-                relevant_errors = [line for line in error_lines if is_relevant_error(line)]
-                if relevant_errors:
-                    print(f"[{tool_name}] Errors: {'; '.join(relevant_errors[:3])}")          # Save clean output to file in graphics-ready format
+            if relevant_errors:
+                print(f"[{tool_name}] Errors: {'; '.join(relevant_errors)}")          # Save clean output to file in graphics-ready format
         if output_file and captured_output:
             try:
                 # Use graphics formatting for the saved file
@@ -737,8 +747,7 @@ def check_tool_availability(tool_name, common_paths=None):
             f"/usr/local/bin/{tool_name}",
             f"/root/go/bin/{tool_name}",
             f"~/go/bin/{tool_name}",
-            f"{os.path.expanduser('~')}/go/bin/{tool_name}",
-            f"{os.path.expanduser('~')}/.local/bin/{tool_name}"
+            f"~/.local/bin/{tool_name}"
         ]
     
     # First check if tool is in PATH
@@ -749,8 +758,8 @@ def check_tool_availability(tool_name, common_paths=None):
                 try:
                     result = subprocess.run(
                         [path_result, flag], 
-                        stdout=subprocess.PIPE, 
-                        stderr=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL, 
+                        stderr=subprocess.DEVNULL,
                         timeout=5
                     )
                     if result.returncode == 0:
@@ -760,17 +769,19 @@ def check_tool_availability(tool_name, common_paths=None):
         except (subprocess.SubprocessError, OSError, FileNotFoundError):
             pass
     
-    # Then check common paths
-    for path in common_paths:
-        expanded_path = os.path.expanduser(path)
+    # Then check common paths - expanded and de-duplicated once (~/go/bin is /root/go/bin
+    # when running as root), skipping the executable already probed above
+    candidates = dict.fromkeys(os.path.expanduser(path) for path in common_paths)
+    candidates.pop(path_result, None)
+    for expanded_path in candidates:
         if os.path.isfile(expanded_path) and os.access(expanded_path, os.X_OK):
             try:
                 for flag in ["--version", "-version", "-v", "--help", "-h"]:
                     try:
                         result = subprocess.run(
                             [expanded_path, flag], 
-                            stdout=subprocess.PIPE, 
-                            stderr=subprocess.PIPE,
+                            stdout=subprocess.DEVNULL, 
+                            stderr=subprocess.DEVNULL,
                             timeout=5
                         )
                         if result.returncode == 0:
@@ -1797,28 +1808,46 @@ def check_network_connectivity():
         ("9.9.9.9", 53)       # Quad9 DNS
     ]
     
-    for dns_host, dns_port in dns_servers:
-        try:
-            print(f"  Trying to connect to {dns_host}:{dns_port}...")
-            with socket.create_connection((dns_host, dns_port), timeout=5) as sock:
-                print(f"  ✓ Successfully connected to {dns_host}")
-                return True
-
-        except (socket.timeout, socket.error, OSError) as e:
-            print(f"  ✗ Failed to connect to {dns_host}: {e}")
-            continue
+    def probe(server):
+        with socket.create_connection(server, timeout=3):
+            return server
+    
+    # Probe all servers at once and stop at the first answer instead of paying
+    # one timeout per unreachable server
+    print(f"  Trying to connect to {', '.join(host for host, _ in dns_servers)}...")
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(dns_servers))
+    try:
+        futures = {executor.submit(probe, server): server for server in dns_servers}
+        for future in concurrent.futures.as_completed(futures):
+            dns_host, dns_port = futures[future]
+            try:
+                future.result()
+            except OSError as e:
+                print(f"  ✗ Failed to connect to {dns_host}: {e}")
+                continue
+            print(f"  ✓ Successfully connected to {dns_host}")
+            return True
+    finally:
+        executor.shutdown(wait=False)
     
-    # Method 2: Try to resolve common domains
+    # Method 2: Try to resolve common domains - also all at once, so a stalled
+    # resolver costs one timeout rather than one per domain
     test_domains = ["google.com", "github.com", "cloudflare.com"]
-    for domain in test_domains:
-        try:
-            print(f"  Trying to resolve {domain}...")
-            socket.gethostbyname(domain)
+    print(f"  Trying to resolve {', '.join(test_domains)}...")
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(test_domains))
+    try:
+        futures = {executor.submit(socket.gethostbyname, domain): domain for domain in test_domains}
+        for future in concurrent.futures.as_completed(futures):
+            domain = futures[future]
+            try:
+                future.result()
+            except OSError as e:
+                print(f"  ✗ Failed to resolve {domain}: {e}")
+                continue
             print(f"  ✓ Successfully resolved {domain}")
             return True
-        except socket.gaierror as e:
-            print(f"  ✗ Failed to resolve {domain}: {e}")
-            continue
+    finally:
+        executor.shutdown(wait=False)
       # Method 3: Try ping with proper Linux parameters
     ping_targets = ["8.8.8.8", "1.1.1.1"]  # Removed localhost as it doesn't test internet connectivity
     for target in ping_targets:
@@ -1978,7 +2007,7 @@ def main():
     parser.add_argument('-s', '--stealth', action='store_true', help='Enable stealth mode for more discreet scanning')
     
     # Enforce Linux-only operation
-    if platform.system().lower() != "linux":
+    if SYSTEM_NAME != "linux":
         print("╔═══════════════════════════════════════════════════════════════╗")
         print("║                             ERROR                             ║")
         print("║                                                               ║")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The installer is a standalone script, not a package: make install/setup.py importable as `setup`
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'install'))
@@ -0,0 +1,49 @@
+import pytest
+
+import setup
+
+KALI = '''PRETTY_NAME="Kali GNU/Linux Rolling"
+NAME="Kali GNU/Linux"
+ID=kali
+ID_LIKE=debian
+'''
+
+UBUNTU = '''PRETTY_NAME="Ubuntu 22.04.4 LTS"
+NAME="Ubuntu"
+ID=ubuntu
+ID_LIKE=debian
+'''
+
+ARCH = '''NAME="Arch Linux"
+PRETTY_NAME="Arch Linux"
+ID=arch
+BUILD_ID=rolling
+'''
+
+# A derivative only recognisable through ID_LIKE, whose PRETTY_NAME mentions another distro
+MINT = '''NAME="Linux Mint"
+PRETTY_NAME="Linux Mint 21.3 (based on Debian tooling)"
+ID=linuxmint
+ID_LIKE="ubuntu debian"
+'''
+
+
+@pytest.fixture
+def os_release(tmp_path, monkeypatch):
+    """Point detect_linux_distro at a temporary os-release file."""
+    path = tmp_path / 'os-release'
+    monkeypatch.setattr(setup, 'OS_RELEASE_PATH', str(path))
+    setup.detect_linux_distro.cache_clear()
+    yield path
+    setup.detect_linux_distro.cache_clear()
+
+
+@pytest.mark.parametrize('content, expected', [
+    (KALI, 'kali'),
+    (UBUNTU, 'ubuntu'),
+    (ARCH, 'arch'),
+    (MINT, 'ubuntu'),
+])
+def test_detect_linux_distro_reads_id_and_id_like(os_release, content, expected):
+    os_release.write_text(content)
+    assert setup.detect_linux_distro() == expected
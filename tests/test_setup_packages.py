@@ -0,0 +1,86 @@
+import subprocess
+
+import setup
+
+DPKG_QUERY_OUTPUT = '''install ok installed gcc
+install ok installed libc6
+deinstall ok config-files pkg-config
+install ok installed python3
+'''
+
+PACMAN_OUTPUT = '''gcc
+glibc
+pkgconfig
+'''
+
+
+def fake_run(outputs, calls):
+    """subprocess.run stand-in answering each command from outputs, keyed by program name."""
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=outputs.get(cmd[0], ''), stderr='')
+    return run
+
+
+def test_installed_packages_counts_only_installed_dpkg_entries(monkeypatch):
+    calls = []
+    monkeypatch.setattr(setup.subprocess, 'run', fake_run({'dpkg-query': DPKG_QUERY_OUTPUT}, calls))
+    installed = setup.installed_packages('debian')
+    assert installed == {'gcc', 'libc6', 'python3'}
+    assert len(calls) == 1 and calls[0][0] == 'dpkg-query'
+
+
+def test_installed_packages_reads_pacman_list(monkeypatch):
+    calls = []
+    monkeypatch.setattr(setup.subprocess, 'run', fake_run({'pacman': PACMAN_OUTPUT}, calls))
+    assert setup.installed_packages('arch') == {'gcc', 'glibc', 'pkgconfig'}
+    assert calls == [['pacman', '-Qq']]
+
+
+def test_installed_packages_is_empty_when_query_fails(monkeypatch):
+    def run(cmd, **kwargs):
+        raise FileNotFoundError(cmd[0])
+    monkeypatch.setattr(setup.subprocess, 'run', run)
+    assert setup.installed_packages('debian') == set()
+
+
+def test_check_system_dependencies_installs_only_missing(monkeypatch):
+    calls = []
+    monkeypatch.setattr(setup.subprocess, 'run', fake_run({'dpkg-query': DPKG_QUERY_OUTPUT}, calls))
+    monkeypatch.setattr(setup, 'repair_package_state', lambda: None)
+    assert setup.check_system_dependencies('debian')
+    # One query for every dependency, then one install of the removed-but-configured pkg-config
+    assert calls[0][0] == 'dpkg-query'
+    assert len(calls) == 2
+    assert calls[1][-1] == 'pkg-config' and 'gcc' not in calls[1]
+
+
+def test_check_system_dependencies_skips_install_when_all_present(monkeypatch):
+    calls = []
+    monkeypatch.setattr(setup.subprocess, 'run', fake_run({'pacman': PACMAN_OUTPUT}, calls))
+    assert setup.check_system_dependencies('arch')
+    assert calls == [['pacman', '-Qq']]
+
+
+def test_apt_install_retries_while_package_manager_holds_lock(monkeypatch):
+    results = iter([False, False, True])
+    calls = []
+
+    def run_with_timeout(cmd, timeout_seconds, description, allow_warnings=True):
+        calls.append(allow_warnings)
+        return next(results)
+
+    monkeypatch.setattr(setup, 'run_with_timeout', run_with_timeout)
+    monkeypatch.setattr(setup, 'find_processes_by_name', lambda names: [4242])
+    monkeypatch.setattr(setup.time, 'sleep', lambda seconds: None)
+    assert setup.apt_install(['gcc'])
+    # Every attempt is judged strictly, even though the caller allows warnings
+    assert calls == [False, False, False]
+
+
+def test_apt_install_applies_warning_policy_after_retries(monkeypatch):
+    monkeypatch.setattr(setup, 'run_with_timeout', lambda *args, **kwargs: False)
+    monkeypatch.setattr(setup, 'find_processes_by_name', lambda names: [])
+    assert setup.apt_install(['gcc'], allow_warnings=True)
+    assert not setup.apt_install(['gcc'], allow_warnings=False)
+    assert not setup.apt_install_batch(['gcc', 'make'])
@@ -0,0 +1,124 @@
+import errno
+import hashlib
+import io
+import os
+import tarfile
+
+import pytest
+
+import setup
+
+
+def make_tarball(names=('go/bin/go',)):
+    """Small in-memory .tar.gz holding go/bin/go by default, like the Go release layout."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        data = b'#!/bin/sh\necho go\n'
+        for name in names:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o755
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def tarball(monkeypatch):
+    """Serve the in-memory archive to urlopen and return its bytes."""
+    payload = make_tarball()
+    monkeypatch.setattr(setup.urllib.request, 'urlopen', lambda url, timeout=None: io.BytesIO(payload))
+    return payload
+
+
+def test_hashing_reader_digest_covers_whole_stream():
+    payload = make_tarball()
+    digest = hashlib.sha256()
+    reader = setup._HashingReader(io.BytesIO(payload), digest)
+    reader.read(10)
+    reader.drain()
+    assert digest.hexdigest() == hashlib.sha256(payload).hexdigest()
+
+
+def test_stream_extract_tarball_installs_on_matching_sha256(tmp_path, tarball):
+    dest = tmp_path / 'usr-local'
+    (dest / 'go').mkdir(parents=True)
+    (dest / 'go' / 'stale').write_text('old toolchain')
+
+    setup.stream_extract_tarball('https://example.invalid/go.tar.gz', str(dest),
+                                 hashlib.sha256(tarball).hexdigest(), privileged=False)
+
+    assert (dest / 'go' / 'bin' / 'go').read_bytes() == b'#!/bin/sh\necho go\n'
+    assert not (dest / 'go' / 'stale').exists()
+    assert sorted(os.listdir(dest)) == ['go']  # No staging or retired directories left behind
+
+
+def test_stream_extract_tarball_rejects_mismatching_sha256(tmp_path, tarball):
+    dest = tmp_path / 'usr-local'
+    (dest / 'go').mkdir(parents=True)
+    (dest / 'go' / 'stale').write_text('old toolchain')
+
+    with pytest.raises(ValueError, match='checksum mismatch'):
+        setup.stream_extract_tarball('https://example.invalid/go.tar.gz', str(dest),
+                                     '0' * 64, privileged=False)
+
+    # The previous tree is untouched and nothing from the rejected archive landed
+    assert (dest / 'go' / 'stale').read_text() == 'old toolchain'
+    assert not (dest / 'go' / 'bin').exists()
+    assert sorted(os.listdir(dest)) == ['go']
+
+
+def test_install_tarball_returns_digest_without_expected_sha256(tmp_path, tarball):
+    actual = setup.install_tarball('https://example.invalid/go.tar.gz', str(tmp_path))
+    assert actual == hashlib.sha256(tarball).hexdigest()
+    assert (tmp_path / 'go' / 'bin' / 'go').exists()
+
+
+def failing_replace(monkeypatch, fail_on_call):
+    """Make the fail_on_call-th os.replace raise EXDEV; every other call goes through."""
+    real_replace = os.replace
+    calls = []
+
+    def replace(src, dst):
+        calls.append((src, dst))
+        if len(calls) == fail_on_call:
+            raise OSError(errno.EXDEV, 'Invalid cross-device link')
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(setup.os, 'replace', replace)
+    return calls
+
+
+def test_install_tarball_restores_old_tree_when_swap_fails(tmp_path, tarball, monkeypatch):
+    dest = tmp_path / 'usr-local'
+    (dest / 'go').mkdir(parents=True)
+    (dest / 'go' / 'stale').write_text('old toolchain')
+    # Call 1 moves the old go/ aside, call 2 (moving the new go/ in) fails
+    failing_replace(monkeypatch, fail_on_call=2)
+
+    with pytest.raises(OSError):
+        setup.install_tarball('https://example.invalid/go.tar.gz', str(dest), hashlib.sha256(tarball).hexdigest())
+
+    assert (dest / 'go' / 'stale').read_text() == 'old toolchain'
+    assert not (dest / 'go' / 'bin').exists()
+    assert sorted(os.listdir(dest)) == ['go']
+
+
+def test_stream_extract_tarball_keeps_both_old_trees_when_swap_fails_partway(tmp_path, monkeypatch):
+    payload = make_tarball(('go/bin/go', 'gopls/bin/gopls'))
+    monkeypatch.setattr(setup.urllib.request, 'urlopen', lambda url, timeout=None: io.BytesIO(payload))
+    dest = tmp_path / 'usr-local'
+    for name in ('go', 'gopls'):
+        (dest / name).mkdir(parents=True)
+        (dest / name / 'stale').write_text(f'old {name}')
+    # Calls 1-2 swap the first entry completely, call 3 (moving the second old entry aside) fails
+    failing_replace(monkeypatch, fail_on_call=3)
+
+    with pytest.raises(OSError):
+        setup.stream_extract_tarball('https://example.invalid/go.tar.gz', str(dest),
+                                     hashlib.sha256(payload).hexdigest(), privileged=False)
+
+    # The already-swapped entry is rolled back too, and no staging/retired directory is left
+    for name in ('go', 'gopls'):
+        assert sorted(os.listdir(dest / name)) == ['stale']
+        assert (dest / name / 'stale').read_text() == f'old {name}'
+    assert sorted(os.listdir(dest)) == ['go', 'gopls']